@@ -0,0 +1,99 @@
+"""
+Generators of synthetic configuration trees, written with `write_file` in any of the supported formats.
+
+Every generator writes its files into `directory` and returns the path of the root configuration.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable
+
+from config_segregate import write_file
+
+FORMATS = ["json", "yaml", "toml"]
+
+
+def reference(path: Path) -> str:
+    return f"${{{{ {path} }}}}"
+
+
+def section(index: int, size: int = 8) -> Dict[Hashable, Any]:
+    return {
+        "name": f"section_{index}",
+        "enabled": index % 2 == 0,
+        "ratio": index / 7,
+        "tags": [f"tag_{tag}" for tag in range(size)],
+        "limits": {f"limit_{limit}": limit * index for limit in range(size)},
+    }
+
+
+def wide_tree(directory: Path, ext: str, width: int = 200) -> Path:
+    """A root referencing `width` independent leaf files."""
+    root: Dict[Hashable, Any] = {"name": "WideTree"}
+
+    for index in range(width):
+        leaf = directory / f"wide_{index}.{ext}"
+        write_file(leaf, section(index))
+        root[f"section_{index}"] = reference(leaf)
+
+    write_file(directory / f"wide_root.{ext}", root)
+
+    return directory / f"wide_root.{ext}"
+
+
+def base_chain(directory: Path, ext: str, depth: int = 50) -> Path:
+    """A chain of `depth` files, each one updating the `__base__` of the previous one."""
+    write_file(directory / f"chain_0.{ext}", {f"section_{index}": section(index) for index in range(depth)})
+
+    for level in range(1, depth + 1):
+        updates: Dict[Hashable, Any] = {
+            "__base__": reference(directory / f"chain_{level - 1}.{ext}"),
+            f"section_{level - 1}": {"enabled": False, "limits": {"limit_0": -level}},
+            "level": level,
+        }
+        write_file(directory / f"chain_{level}.{ext}", updates)
+
+    return directory / f"chain_{depth}.{ext}"
+
+
+def diamond_graph(directory: Path, ext: str, layers: int = 4, width: int = 4) -> Path:
+    """Layers of `width` files, each one referencing every file of the next layer, above a single shared leaf."""
+    write_file(directory / f"diamond_leaf.{ext}", section(0))
+    below = [directory / f"diamond_leaf.{ext}"]
+
+    for layer in reversed(range(layers)):
+        current = []
+
+        for index in range(width):
+            path = directory / f"diamond_{layer}_{index}.{ext}"
+            data: Dict[Hashable, Any] = {
+                f"child_{child}": reference(child_path) for child, child_path in enumerate(below)
+            }
+            data["__base__"] = reference(below[index % len(below)])
+            write_file(path, data)
+            current.append(path)
+
+        below = current
+
+    write_file(directory / f"diamond_root.{ext}", {f"entry_{index}": reference(path) for index, path in enumerate(below)})
+
+    return directory / f"diamond_root.{ext}"
+
+
+def large_leaf(directory: Path, ext: str, megabytes: float = 1.0) -> Path:
+    """A root extending a single leaf file of roughly `megabytes` megabytes."""
+    sections = max(int(megabytes * 1024 * 1024 / 280), 1)
+    write_file(directory / f"large_leaf.{ext}", {f"section_{index}": section(index) for index in range(sections)})
+    write_file(
+        directory / f"large_root.{ext}",
+        {"__base__": reference(directory / f"large_leaf.{ext}"), "section_0": {"enabled": False}},
+    )
+
+    return directory / f"large_root.{ext}"
+
+
+GENERATORS: Dict[str, Callable[[Path, str], Path]] = {
+    "wide": wide_tree,
+    "chain": base_chain,
+    "diamond": diamond_graph,
+    "large": large_leaf,
+}
@@ -0,0 +1,99 @@
+"""
+Measures `load_config` on synthetic configuration trees: wide trees, deep `__base__` chains, diamond include graphs
+and multi-MB leaf files, in every format.
+
+For every tree it reports the best load time, the throughput in files and MiB per second, the peak memory traced by
+`tracemalloc` and the time spent in each stage reported to the profiling observers.
+
+Run from the repository root with `python -m benchmarks.load`. Pass `--save results.json` to keep the timings and
+`--compare results.json` on a later run to exit with an error when a tree got slower than `--tolerance` allows.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.generators import FORMATS, GENERATORS
+from config_segregate import ProfileCollector, load_config
+
+STAGES = ["stat", "read", "merge", "load"]
+
+
+def stage_times(path: Path) -> Dict[str, float]:
+    """Total time of every stage of a single load, in seconds, with `load` covering the whole call."""
+    with ProfileCollector() as collector:
+        load_config(path)
+
+    times = dict.fromkeys(STAGES, 0.0)
+
+    for event in collector.events:
+        if event.kind in times:
+            times[event.kind] += event.elapsed
+
+    return times
+
+
+def peak_memory(path: Path) -> int:
+    """Peak memory allocated by a single load, in bytes."""
+    tracemalloc.start()
+
+    try:
+        load_config(path)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=FORMATS, help="Formats of the trees.")
+    parser.add_argument("--trees", nargs="+", choices=list(GENERATORS), default=list(GENERATORS), help="Trees to load.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs, the best one is reported.")
+    parser.add_argument("--save", type=Path, help="Write the load times to this JSON file.")
+    parser.add_argument("--compare", type=Path, help="Compare the load times with a file written by `--save`.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown when comparing, 0.2 is 20%%.")
+    args = parser.parse_args()
+
+    results: Dict[str, float] = dict()
+    regressions: List[str] = []
+    baseline: Dict[str, float] = json.loads(args.compare.read_text()) if args.compare else dict()
+
+    print(f"{'tree':>14} {'files':>6} {'KiB':>8} {'load ms':>9} {'files/s':>9} {'MiB/s':>7} {'peak KiB':>9}  stages ms")
+
+    for ext in args.formats:
+        for name in args.trees:
+            with tempfile.TemporaryDirectory() as directory:
+                root = GENERATORS[name](Path(directory), ext)
+                files = list(Path(directory).iterdir())
+                nbytes = sum(path.stat().st_size for path in files)
+
+                load_time = min(timeit.repeat(lambda: load_config(root), number=1, repeat=args.repeat))
+                peak = peak_memory(root)
+                stages = stage_times(root)
+
+            key = f"{name}.{ext}"
+            results[key] = load_time
+            print(
+                f"{key:>14} {len(files):>6} {nbytes / 1024:>8.0f} {load_time * 1000:>9.2f} "
+                f"{len(files) / load_time:>9.0f} {nbytes / 1024 / 1024 / load_time:>7.1f} {peak / 1024:>9.0f}  "
+                + " ".join(f"{stage} {elapsed * 1000:.2f}" for stage, elapsed in stages.items())
+            )
+
+            if key in baseline and load_time > baseline[key] * (1 + args.tolerance):
+                regressions.append(f"{key}: {baseline[key] * 1000:.2f} ms -> {load_time * 1000:.2f} ms")
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+
+    if regressions:
+        print("Slower than the baseline:\n" + "\n".join(regressions), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares `merge_nested_dict` with the `deepcopy` + `update_nested_dict` pattern needed to reuse a parsed base.
+
+Run from the repository root with `python -m benchmarks.merge`.
+"""
+
+import argparse
+import timeit
+from copy import deepcopy
+from typing import Any, Dict, Hashable, Tuple
+
+from config_segregate import merge_nested_dict
+from config_segregate.core import update_nested_dict
+
+
+def wide_trees(width: int) -> Tuple[Dict[Hashable, Any], Dict[Hashable, Any]]:
+    base: Dict[Hashable, Any] = {
+        f"section_{index}": {"enabled": True, "values": list(range(10))} for index in range(width)
+    }
+    updates: Dict[Hashable, Any] = {f"section_{index}": {"enabled": False} for index in range(0, width, 10)}
+
+    return base, updates
+
+
+def deep_trees(depth: int) -> Tuple[Dict[Hashable, Any], Dict[Hashable, Any]]:
+    base: Dict[Hashable, Any] = {"leaf": 0}
+    updates: Dict[Hashable, Any] = {"leaf": 1}
+
+    for index in range(depth):
+        base = {"nested": base, "sibling": {"index": index, "values": list(range(10))}}
+        updates = {"nested": updates}
+
+    return base, updates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=10_000, help="Number of sections of the wide tree.")
+    parser.add_argument("--depth", type=int, default=200, help="Nesting depth of the deep tree.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs, the best one is reported.")
+    args = parser.parse_args()
+
+    for name, (base, updates) in [
+        (f"wide ({args.width} sections)", wide_trees(args.width)),
+        (f"deep ({args.depth} levels)", deep_trees(args.depth)),
+    ]:
+        copy_time = min(
+            timeit.repeat(lambda: update_nested_dict(deepcopy(base), deepcopy(updates)), number=1, repeat=args.repeat)
+        )
+        merge_time = min(timeit.repeat(lambda: merge_nested_dict(base, updates), number=1, repeat=args.repeat))
+        print(f"{name:>22}: deepcopy + update {copy_time * 1000:8.2f} ms, merge {merge_time * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
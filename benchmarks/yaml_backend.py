@@ -0,0 +1,49 @@
+"""
+Compares the libyaml and pure-Python YAML backends on the test fixtures scaled up to thousands of keys.
+
+Run from the repository root with `python -m benchmarks.yaml_backend`.
+"""
+
+import argparse
+import io
+import timeit
+from typing import Any, Dict, Hashable, List, Tuple
+
+import yaml
+
+from tests.conftest import SEGREGATED_CONFIGS
+
+
+def scaled_fixtures(copies: int) -> Dict[Hashable, Any]:
+    return {f"{name}_{index}": config for index in range(copies) for name, config in SEGREGATED_CONFIGS.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--copies", type=int, default=500, help="Number of copies of the fixtures to merge.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs, the best one is reported.")
+    args = parser.parse_args()
+
+    data = scaled_fixtures(args.copies)
+    document = yaml.dump(data, Dumper=yaml.SafeDumper)
+    print(f"{len(data)} top-level keys, {len(document) / 1024:.0f} KiB of YAML")
+
+    backends: List[Tuple[str, Any, Any]] = [("python", yaml.SafeLoader, yaml.SafeDumper)]
+
+    if yaml.__with_libyaml__:
+        backends.append(("libyaml", yaml.CSafeLoader, yaml.CSafeDumper))
+    else:
+        print("PyYAML was built without libyaml, only the pure-Python backend is available.")
+
+    for name, loader, dumper in backends:
+        load_time = min(
+            timeit.repeat(lambda: yaml.load(io.StringIO(document), Loader=loader), number=1, repeat=args.repeat)
+        )
+        dump_time = min(
+            timeit.repeat(lambda: yaml.dump(data, io.StringIO(), Dumper=dumper), number=1, repeat=args.repeat)
+        )
+        print(f"{name:>8}: load {load_time * 1000:8.1f} ms, dump {dump_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,25 @@
-from importlib.metadata import PackageNotFoundError, version
+from typing import Any
 
+from .cache import *
 from .core import *
+from .export import *
+from .frozen import *
+from .graph import *
+from .profiling import *
 from .readers import *
+from .snapshot import *
+from .watch import *
 from .writers import *
 
-try:
-    __version__ = version("config_segregate")
-except PackageNotFoundError:
-    __version__ = "0.0.0"
+
+def __getattr__(name: str) -> Any:
+    # `importlib.metadata` is slow to import, so the version is only looked up when asked for.
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            return version("config_segregate")
+        except PackageNotFoundError:
+            return "0.0.0"
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import date, datetime, time
+from pathlib import Path
+from threading import Lock
+from typing import Any, Hashable, NamedTuple, Optional, Tuple
+
+__all__ = [
+    "CacheInfo",
+    "FileCache",
+    "copy_tree",
+]
+
+
+MISSING: Any = object()
+"""Sentinel returned by `FileCache.get` when no valid entry exists."""
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None), date, datetime, time)
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, mirroring the tuple returned by `functools.lru_cache` wrappers."""
+
+    hits: int
+    """Number of lookups served from the cache."""
+    misses: int
+    """Number of lookups that had to read and parse the file."""
+    maxsize: Optional[int]
+    """Maximum number of entries the cache may hold, `None` if unbounded."""
+    currsize: int
+    """Number of entries currently held by the cache."""
+
+
+class FileCache:
+    """
+    Thread-safe LRU cache of parsed files.
+
+    Entries are keyed on the resolved path of a file and validated against a signature of its `os.stat` result,
+    so a file that changed on disk simply replaces its previous entry. The cache is bounded both by the number of
+    entries and by the total size of the cached files on disk, evicting the least recently used entries first.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, maxbytes: Optional[int] = None) -> None:
+        """
+        Args:
+            maxsize (Optional[int]): Maximum number of cached files, `None` for no limit.
+            maxbytes (Optional[int]): Maximum total on-disk size of the cached files, `None` for no limit.
+        """
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self.currbytes = 0
+        self._entries: OrderedDict[Path, Tuple[Hashable, Any, int]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Path, signature: Hashable) -> Any:
+        """
+        Looks up the parsed data of a file.
+
+        Args:
+            key (Path): The resolved path of the file.
+            signature (Hashable): The current signature of the file, stale entries are treated as missing.
+
+        Returns:
+            Any: The cached data, or `MISSING` if there is no valid entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] != signature:
+                self.misses += 1
+                return MISSING
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+
+            return entry[1]
+
+    def put(self, key: Path, signature: Hashable, data: Any, nbytes: int) -> None:
+        """
+        Stores the parsed data of a file, evicting least recently used entries to stay within budget.
+
+        Args:
+            key (Path): The resolved path of the file.
+            signature (Hashable): The signature of the file the data was parsed from.
+            data (Any): The parsed data.
+            nbytes (int): The size of the file on disk, counted against `maxbytes`.
+        """
+        if self.maxbytes is not None and nbytes > self.maxbytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+
+            if previous is not None:
+                self.currbytes -= previous[2]
+
+            self._entries[key] = (signature, data, nbytes)
+            self.currbytes += nbytes
+
+            while (self.maxsize is not None and len(self._entries) > self.maxsize) or (
+                self.maxbytes is not None and self.currbytes > self.maxbytes
+            ):
+                _, (_, _, evicted_nbytes) = self._entries.popitem(last=False)
+                self.currbytes -= evicted_nbytes
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Reports the cache statistics.
+
+        Returns:
+            CacheInfo: Hits, misses, the entry budget and the number of cached files.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        """Drops every cached file and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.currbytes = 0
+
+
+def copy_tree(data: Any) -> Any:
+    """
+    Copies parsed configuration data, recursing into dictionaries and lists and sharing immutable scalars.
+
+    Args:
+        data (Any): The data to copy.
+
+    Returns:
+        Any: An independent copy of `data`.
+    """
+    if isinstance(data, dict):
+        return {key: copy_tree(value) for key, value in data.items()}
+
+    if isinstance(data, list):
+        return [copy_tree(item) for item in data]
+
+    if isinstance(data, _IMMUTABLE_TYPES):
+        return data
+
+    return deepcopy(data)
@@ -0,0 +1,388 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stderr, redirect_stdout
+from io import StringIO
+from os import PathLike
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .core import (
+    BASE_CONFIG_KEY,
+    SEGREGATE_OPTIONS_KEY,
+    KeyPath,
+    ResolutionContext,
+    load_config,
+    load_configs,
+    parse_reference,
+    resolve_config,
+)
+from .profiling import ProfileCollector
+from .readers import enable_cache
+from .writers import _serialize, write_file
+
+__all__ = [
+    "main",
+]
+
+
+PROG = "config-segregate"
+"""Name of the command installed with the package."""
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the `config-segregate` command, also available as `python -m config_segregate`.
+
+    Args:
+        argv (Optional[Sequence[str]]): The arguments of the command, without the program name. `sys.argv[1:]` if
+            omitted.
+
+    Returns:
+        int: The exit status of the command.
+    """
+    return _main(sys.argv[1:] if argv is None else list(argv), serving=False)
+
+
+def _main(argv: List[str], serving: bool) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "serve" and (serving or args.connect is not None):
+        parser.error("`serve` can't be sent to a server.")
+
+    if args.connect is not None and not serving:
+        return _request(args.connect, argv)
+
+    try:
+        handler: Callable[[argparse.Namespace], int] = args.handler
+        return handler(args)
+    except Exception as error:
+        if not isinstance(error, _reported_errors()):
+            raise
+
+        print(f"{PROG}: error: {error}", file=sys.stderr)
+        return 1
+
+
+def _reported_errors() -> Tuple[Type[Exception], ...]:
+    # Errors of invalid inputs, reported without a traceback. `toml` and the JSON backends raise subclasses of
+    # `ValueError`, and `yaml` is imported on first use, so its errors can only be raised once it is imported.
+    errors: List[Type[Exception]] = [ImportError, OSError, KeyError, ValueError]
+    yaml = sys.modules.get("yaml")
+
+    if yaml is not None:
+        errors.append(yaml.YAMLError)
+
+    return tuple(errors)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog=PROG, description="Loads configurations split into files linked with `${{ path }}` references."
+    )
+    parser.add_argument(
+        "--connect",
+        metavar="SOCKET",
+        help="Run the command in the server listening on this Unix socket, started with `serve`.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+
+    render = commands.add_parser(
+        "render",
+        help="Write the processed configurations.",
+        description="Loads configurations and writes them with every reference and `__base__` resolved.",
+    )
+    render.add_argument("inputs", nargs="+", metavar="INPUT", help="Configuration files to load.")
+    outputs = render.add_mutually_exclusive_group()
+    outputs.add_argument(
+        "-o", "--output", type=Path, help="File to write a single configuration to, standard output if omitted."
+    )
+    outputs.add_argument(
+        "-d", "--output-dir", type=Path, help="Folder to write each configuration to, under the name of its input."
+    )
+    render.add_argument(
+        "-f", "--format", help="Format of the configurations not written to `--output`, their input's if omitted."
+    )
+    render.add_argument(
+        "-j", "--jobs", type=int, help="Number of processes loading the configurations, all in this one if omitted."
+    )
+    render.add_argument(
+        "--relative-to-file", action="store_true", help="Resolve references against the folder of their file."
+    )
+    render.set_defaults(handler=_render)
+
+    bench = commands.add_parser(
+        "bench",
+        help="Time the loading of configurations.",
+        description="Loads configurations repeatedly and reports the load times, the time spent in each stage and "
+        "the files taking the longest.",
+    )
+    bench.add_argument("inputs", nargs="+", metavar="INPUT", help="Configuration files to load.")
+    bench.add_argument("-n", "--repeat", type=int, default=10, help="Number of timed loads of each configuration.")
+    bench.set_defaults(handler=_bench)
+
+    explain = commands.add_parser(
+        "explain",
+        help="Show the file supplying each value.",
+        description="Loads a configuration and prints every value with the file it comes from.",
+    )
+    explain.add_argument("input", metavar="INPUT", help="Configuration file to load.")
+    explain.add_argument("keys", nargs="*", metavar="KEY", help="Dotted key paths of the only sections to show.")
+    explain.add_argument(
+        "--relative-to-file", action="store_true", help="Resolve references against the folder of their file."
+    )
+    explain.set_defaults(handler=_explain)
+
+    serve = commands.add_parser(
+        "serve",
+        help="Run commands sent over a Unix socket.",
+        description="Listens on a Unix socket and runs the commands sent with `--connect`, one at a time, keeping "
+        "parsed files cached between them. Files are re-read once they change.",
+    )
+    serve.add_argument("socket", metavar="SOCKET", help="Path of the Unix socket to listen on.")
+    serve.add_argument("--cache-size", type=int, default=1024, help="Maximum number of cached files.")
+    serve.add_argument("--cache-bytes", type=int, help="Maximum total size of the cached files.")
+    serve.set_defaults(handler=_serve)
+
+    return parser
+
+
+def _render(args: argparse.Namespace) -> int:
+    if args.output_dir is None and len(args.inputs) > 1:
+        raise ValueError("Several configurations can only be written with `--output-dir`.")
+
+    extension = None if args.format is None else "." + args.format.lstrip(".")
+    targets: Dict[str, Optional[Path]] = dict()
+
+    for path_to_file in args.inputs:
+        if args.output_dir is not None:
+            target = args.output_dir / (Path(path_to_file).stem + (extension or Path(path_to_file).suffix))
+
+            if target in targets.values():
+                raise ValueError(f"Several configurations would be written to `{target}`.")
+
+            targets[path_to_file] = target
+        else:
+            targets[path_to_file] = args.output
+
+    if args.output_dir is not None:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    context = ResolutionContext(relative_to_file=args.relative_to_file)
+    pool: ContextManager[Optional[Executor]]
+
+    if args.jobs is None:
+        pool = nullcontext()
+    else:
+        pool = ProcessPoolExecutor(args.jobs)
+
+    with pool as executor:
+        for path_to_file, config in load_configs(args.inputs, context, executor):
+            target = targets[path_to_file]
+
+            if target is None:
+                _print_config(config, extension or Path(path_to_file).suffix)
+            else:
+                write_file(target, config, overwrite=True, atomic=True, skip_unchanged=True)
+
+    return 0
+
+
+def _print_config(config: Dict[Hashable, Any], extension: str) -> None:
+    content = _serialize(Path("stdout" + extension), config)
+
+    try:
+        text = None if content is None else content.decode()
+    except UnicodeDecodeError:
+        text = None
+
+    if text is None:
+        raise ValueError(f"`{extension}` configurations can't be written to standard output.")
+
+    sys.stdout.write(text if text.endswith("\n") else text + "\n")
+
+
+def _bench(args: argparse.Namespace) -> int:
+    stages = ["stat", "read", "merge", "load"]
+
+    for path_to_file in args.inputs:
+        times = []
+
+        for _ in range(args.repeat):
+            start = perf_counter()
+            load_config(path_to_file)
+            times.append(perf_counter() - start)
+
+        with ProfileCollector() as collector:
+            load_config(path_to_file)
+
+        stage_times = dict.fromkeys(stages, 0.0)
+
+        for event in collector.events:
+            if event.kind in stage_times:
+                stage_times[event.kind] += event.elapsed
+
+        print(
+            f"{path_to_file}: best {min(times) * 1000:.3f} ms, median {median(times) * 1000:.3f} ms "
+            f"of {args.repeat} loads"
+        )
+        print("stages " + ", ".join(f"{stage} {elapsed * 1000:.3f} ms" for stage, elapsed in stage_times.items()))
+        print(collector.table())
+
+    return 0
+
+
+def _explain(args: argparse.Namespace) -> int:
+    context = _SourceContext(relative_to_file=args.relative_to_file)
+    config = resolve_config(context.read(args.input), context, args.input)
+    prefixes = [tuple(key.split(".")) for key in args.keys]
+
+    for key_path, value in _sourced_values(config, ()):
+        keys = tuple(str(key) for key in key_path)
+
+        if prefixes and not any(keys[: len(prefix)] == prefix for prefix in prefixes):
+            continue
+
+        print(f"{'.'.join(keys)} = {json.dumps(value.value, default=str)}  ({value.path})")
+
+    return 0
+
+
+class _Sourced:
+    # Leaf value tagged with the file it was read from. It is neither a container nor a reference, so references
+    # and merges move it around like any other value.
+    __slots__ = ("value", "path")
+
+    def __init__(self, value: Any, path: Path) -> None:
+        self.value = value
+        self.path = path
+
+
+class _SourceContext(ResolutionContext):
+    # Hands out the parsed files with every leaf value tagged with its file.
+    def __init__(self, relative_to_file: bool) -> None:
+        super().__init__(relative_to_file=relative_to_file)
+        self._sourced: Dict[Path, Any] = dict()
+
+    def read(self, path_to_file: Union[str, PathLike[str], Path]) -> Any:
+        key = self.resolve(path_to_file)
+
+        if key not in self._sourced:
+            self._sourced[key] = _tag_sources(super().read(path_to_file), key)
+
+        return self._sourced[key]
+
+
+def _tag_sources(data: Any, path: Path) -> Any:
+    if isinstance(data, dict):
+        # Options and missing bases steer the merges and are never part of the configuration, so they stay as is.
+        return {
+            key: value
+            if key == SEGREGATE_OPTIONS_KEY or (key == BASE_CONFIG_KEY and value is None)
+            else _tag_sources(value, path)
+            for key, value in data.items()
+        }
+
+    if isinstance(data, (list, tuple)) and data:
+        return [_tag_sources(value, path) for value in data]
+
+    return data if parse_reference(data) is not None else _Sourced(data, path)
+
+
+def _sourced_values(data: Any, key_path: KeyPath) -> Iterator[Tuple[KeyPath, _Sourced]]:
+    if isinstance(data, _Sourced):
+        yield key_path, data
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            yield from _sourced_values(value, key_path + (key,))
+    elif isinstance(data, list):
+        for index, value in enumerate(data):
+            yield from _sourced_values(value, key_path + (index,))
+
+
+def _serve(args: argparse.Namespace) -> int:
+    import signal
+    import socket
+
+    def stop(signum: int, frame: Any) -> None:
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    enable_cache(args.cache_size, args.cache_bytes)
+    # Commands change the working directory to the one of their client.
+    socket_path = Path(args.socket).resolve()
+
+    if socket_path.is_socket():
+        socket_path.unlink()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        server.listen()
+
+        try:
+            while True:
+                connection, _ = server.accept()
+
+                with connection, connection.makefile("rwb") as stream:
+                    try:
+                        for line in stream:
+                            stream.write(json.dumps(_handle(line)).encode() + b"\n")
+                            stream.flush()
+                    except OSError:
+                        continue
+        except KeyboardInterrupt:
+            return 0
+        finally:
+            socket_path.unlink()
+
+
+def _handle(line: bytes) -> Dict[str, Any]:
+    stdout, stderr = StringIO(), StringIO()
+
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            request = json.loads(line)
+            os.chdir(request["cwd"])
+            status = _main(request["argv"], serving=True)
+        except SystemExit as error:
+            status = error.code if isinstance(error.code, int) else 1
+        except Exception as error:
+            print(f"{PROG}: error: {error!r}", file=sys.stderr)
+            status = 1
+
+    return {"status": status, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def _request(socket_path: str, argv: List[str]) -> int:
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps({"argv": argv, "cwd": os.getcwd()}).encode() + b"\n")
+            stream.flush()
+            response = json.loads(stream.readline())
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+
+    return int(response["status"])
@@ -1,18 +1,55 @@
+import os
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from itertools import islice
 from os import PathLike
 from pathlib import Path
-from typing import Any, Dict, Hashable, List, TypedDict, Union
+from time import perf_counter
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+    overload,
+)
 
-from .readers import read_file
+from .cache import CacheInfo
+from .frozen import FrozenDict, freeze
+from .profiling import OBSERVERS, ProfileEvent, notify
+from .readers import _read_file_async, _read_file_with_stat
+from .snapshot import load_snapshot, save_snapshot
+from .writers import _dumps_json
 
 __all__ = [
     "PATH_PREFIX",
     "PATH_SUFFIX",
     "BASE_CONFIG_KEY",
     "SEGREGATE_OPTIONS_KEY",
+    "KeyPath",
     "SegregateOptions",
+    "IncludeCycleError",
+    "IncludeLimitError",
+    "ResolutionContext",
+    "LazyConfig",
+    "parse_reference",
+    "merge_nested_dict",
+    "find_references",
     "load_config",
+    "load_configs",
+    "load_config_async",
     "load_segregated_configs",
     "load_base_config",
+    "resolve_config",
 ]
 
 
@@ -27,6 +64,27 @@ SEGREGATE_OPTIONS_KEY = r"__segregate_options__"
 """Key in the configuration dictionary that specifies options for segregating
 or updating the nested configuration data."""
 
+REFERENCE_SCAN_THRESHOLD = 64
+"""Number of items from which a container is scanned for references and bases before being walked, so a large
+container without any, e.g. a generated lookup table, is passed through whole. Containers below a scanned one of the
+same file are walked without being scanned again."""
+
+KeyPath = Tuple[Hashable, ...]
+"""A path of keys (and list indices) leading to a value inside a nested configuration."""
+
+
+class IncludeCycleError(ValueError):
+    """Raised when a file references itself, directly or through other files."""
+
+    def __init__(self, chain: Tuple[Path, ...]) -> None:
+        self.chain = chain
+        """Resolved paths of the include chain, starting and ending with the same file."""
+        super().__init__("Include cycle detected: " + " -> ".join(f"`{path}`" for path in chain))
+
+
+class IncludeLimitError(ValueError):
+    """Raised when resolving a configuration exceeds the `max_depth` or `max_files` limit of its context."""
+
 
 class SegregateOptions(TypedDict):
     disable_nested_update: bool
@@ -35,10 +93,258 @@ class SegregateOptions(TypedDict):
     """List of keys to be removed from the configuration during the update process."""
 
 
+class ResolutionContext:
+    """
+    Per-load cache of the files referenced by a configuration.
+
+    Each file is read and parsed at most once per context, keyed on its resolved path, so a file referenced
+    from many places (e.g. a shared base in a diamond-shaped include graph) is only opened once. The parsed
+    data is treated as read-only: `load_segregated_configs` and `resolve_config` rebuild every dictionary and list
+    they walk, so each reference receives an independent tree and later updates cannot leak between references.
+
+    The context also bounds the resolution: `max_depth` limits how deeply references may be nested and
+    `max_files` limits how many references a single configuration may resolve.
+
+    Relative reference paths are resolved against the current working directory, or against the directory of the
+    file containing the reference with `relative_to_file`, which does not depend on the process state and lets
+    several configurations be loaded concurrently from different directories. Resolved paths are memoized, so the
+    working directory must not change while the context is in use.
+    """
+
+    def __init__(
+        self, max_depth: Optional[int] = None, max_files: Optional[int] = None, relative_to_file: bool = False
+    ) -> None:
+        """
+        Args:
+            max_depth (Optional[int]): Maximum number of nested references, `None` for no limit.
+            max_files (Optional[int]): Maximum number of references resolved by a single `load_segregated_configs`
+                or `resolve_config` call, counting every reference to the same file, `None` for no limit.
+            relative_to_file (bool): Resolve relative reference paths against the directory of the file containing
+                the reference instead of the current working directory.
+        """
+        self.max_depth = max_depth
+        self.max_files = max_files
+        self.relative_to_file = relative_to_file
+        self.hits = 0
+        """Number of reads served from the cache."""
+        self.misses = 0
+        """Number of reads that had to read and parse the file."""
+        self._parsed: Dict[Path, Any] = dict()
+        self._resolved: Dict[str, Path] = dict()
+        # `os.stat` of the parsed files taken before reading them, which snapshots compare with their manifest.
+        self._read_stats: Dict[Path, os.stat_result] = dict()
+        # Files read, from the cache or not, while `load_configs` loads one configuration of its batch.
+        self._used: Optional[Set[Path]] = None
+
+    @property
+    def files(self) -> List[Path]:
+        """Resolved paths of every file read through this context."""
+        return list(self._parsed)
+
+    def resolve(self, path_to_file: Union[str, PathLike[str], Path]) -> Path:
+        """
+        Resolves the path of a file into the key identifying it in the cache.
+
+        Every spelling of a path is resolved once, so different spellings of the same file (e.g. `./a/../b.json`
+        and `b.json`) share one cache entry without touching the filesystem again.
+
+        Args:
+            path_to_file (Union[str, PathLike[str], Path]): The path to the file.
+
+        Returns:
+            Path: The absolute path of the file, with symlinks resolved.
+        """
+        spelling = os.fspath(path_to_file)
+        path = self._resolved.get(spelling)
+
+        if path is None:
+            path = self._resolved[spelling] = Path(spelling).resolve()
+
+        return path
+
+    def locate(self, trimmed_path: str, origin: Optional[Path] = None) -> Path:
+        """
+        Finds the file a reference points to.
+
+        Args:
+            trimmed_path (str): The path of the reference, see `parse_reference`.
+            origin (Optional[Path]): The resolved path of the file containing the reference, if any.
+
+        Returns:
+            Path: The path of the referenced file, relative to the directory of `origin` with `relative_to_file`.
+        """
+        path = Path(trimmed_path)
+
+        if self.relative_to_file and origin is not None and not path.is_absolute():
+            return origin.parent / path
+
+        return path
+
+    def read(self, path_to_file: Union[str, PathLike[str], Path]) -> Any:
+        """
+        Returns the parsed content of a file, reading it only on the first request.
+
+        Args:
+            path_to_file (Union[str, PathLike[str], Path]): The path to the file to be read.
+
+        Returns:
+            Any: The parsed content of the file. It is shared between reads and must not be mutated.
+        """
+        key = self.resolve(path_to_file)
+
+        if self._used is not None:
+            self._used.add(key)
+
+        if key in self._parsed:
+            self.hits += 1
+            return self._parsed[key]
+
+        self.misses += 1
+        data, self._read_stats[key] = _read_file_with_stat(path_to_file, copy_cached=False)
+        self._parsed[key] = data
+
+        return data
+
+    def prefetch(self, paths_to_files: Iterable[Union[str, PathLike[str], Path]], executor: Executor) -> None:
+        """
+        Reads the given files and every file they reference, parsing independent files concurrently.
+
+        References are discovered level by level: all files of one level are read in parallel on `executor`, then
+        the references found in them form the next level. Files already held by the context are skipped, which also
+        stops the discovery on include cycles.
+
+        Args:
+            paths_to_files (Iterable[Union[str, PathLike[str], Path]]): The files to start the discovery from.
+            executor (Executor): The executor running the reads, e.g. a `ThreadPoolExecutor` for slow filesystems
+                or a `ProcessPoolExecutor` for CPU-heavy parsing.
+        """
+        level = list(paths_to_files)
+
+        while level:
+            pending = self._pending(level)
+            futures = [executor.submit(_read_file_with_stat, path_to_file, False) for path_to_file in pending.values()]
+            results = [future.result() for future in futures]
+            level = [
+                path for key, (data, file_stat) in zip(pending, results) for path in self._store(key, data, file_stat)
+            ]
+
+    async def prefetch_async(
+        self, paths_to_files: Iterable[Union[str, PathLike[str], Path]], max_concurrency: int = 16
+    ) -> None:
+        """
+        Reads the given files and every file they reference without blocking the running event loop.
+
+        Works like `prefetch`, gathering the reads of each level with `read_file_async` semantics.
+
+        Args:
+            paths_to_files (Iterable[Union[str, PathLike[str], Path]]): The files to start the discovery from.
+            max_concurrency (int): Maximum number of files read at the same time.
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def read(path_to_file: Union[str, PathLike[str], Path]) -> Any:
+            async with semaphore:
+                return await _read_file_async(path_to_file, copy_cached=False)
+
+        level = list(paths_to_files)
+
+        while level:
+            pending = self._pending(level)
+            results = await asyncio.gather(*(read(path_to_file) for path_to_file in pending.values()))
+            level = [path for key, data in zip(pending, results) for path in self._store(key, data, None)]
+
+    def _pending(
+        self, paths_to_files: Iterable[Union[str, PathLike[str], Path]]
+    ) -> Dict[Path, Union[str, PathLike[str], Path]]:
+        pending: Dict[Path, Union[str, PathLike[str], Path]] = dict()
+
+        for path_to_file in paths_to_files:
+            key = self.resolve(path_to_file)
+
+            if key not in self._parsed and key not in pending:
+                pending[key] = path_to_file
+
+        return pending
+
+    def _store(self, key: Path, data: Any, file_stat: Optional[os.stat_result]) -> List[Path]:
+        self._parsed[key] = data
+        self.misses += 1
+
+        if file_stat is not None:
+            self._read_stats[key] = file_stat
+
+        return [self.locate(trimmed_path, key) for _, trimmed_path in find_references(data)]
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Reports the cache statistics of this context.
+
+        Returns:
+            CacheInfo: Hits, misses and the number of parsed files held by the context.
+        """
+        return CacheInfo(self.hits, self.misses, None, len(self._parsed))
+
+    def cache_clear(self) -> None:
+        """Drops every parsed file and resolved path, and resets the statistics."""
+        self._parsed.clear()
+        self._resolved.clear()
+        self._read_stats.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def parse_reference(value: Any) -> Optional[str]:
+    """
+    Extracts the file path from a `${{ path }}` reference.
+
+    Args:
+        value (Any): The value to inspect.
+
+    Returns:
+        Optional[str]: The trimmed path if `value` is a reference, otherwise `None`.
+    """
+    if isinstance(value, str) and value.startswith(PATH_PREFIX) and value.endswith(PATH_SUFFIX):
+        return value[len(PATH_PREFIX) : -len(PATH_SUFFIX)].strip()
+
+    return None
+
+
+def find_references(data: Any, prefix: KeyPath = ()) -> Iterator[Tuple[KeyPath, str]]:
+    """
+    Finds the `${{ path }}` references nested inside configuration data, without reading them.
+
+    Args:
+        data (Any): The configuration data to scan.
+        prefix (KeyPath): The key path of `data`, prepended to every yielded key path.
+
+    Yields:
+        Tuple[KeyPath, str]: The key path of each reference and its trimmed path.
+    """
+    stack: List[Tuple[KeyPath, Any]] = [(prefix, data)]
+
+    while stack:
+        key_path, value = stack.pop()
+        # `data` itself is only scanned, e.g. a file whose whole content is a reference is not followed.
+        trimmed_path = parse_reference(value) if key_path != prefix else None
+
+        if trimmed_path is not None:
+            yield key_path, trimmed_path
+        elif isinstance(value, dict):
+            stack.extend((key_path + (key,), item) for key, item in reversed(value.items()))
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(reversed([(key_path + (index,), item) for index, item in enumerate(value)]))
+
+
 def update_nested_dict(data: Dict[Hashable, Any], updates: Any) -> Any:
     """
     Recursively updates a nested dictionary with new values.
 
+    Mutates `data` in place and pops the `SegregateOptions` out of `updates`, see `merge_nested_dict` for a
+    non-mutating alternative. Nested dictionaries are walked with an explicit stack, so the nesting depth is
+    not bound by the recursion limit.
+
     Args:
         data (Dict[Hashable, Any]): The original dictionary to be updated.
         updates (Any): The updates to apply, which can be a dictionary or another value.
@@ -46,87 +352,990 @@ def update_nested_dict(data: Dict[Hashable, Any], updates: Any) -> Any:
     Returns:
         Dict[Hashable, Any]: The updated dictionary.
     """
-    if not isinstance(updates, dict):
-        return updates
+    result: List[Any] = [updates]
+    stack: List[Tuple[Dict[Hashable, Any], Any, Any, Hashable]] = [(data, updates, result, 0)]
 
-    segregate_options: SegregateOptions = updates.pop(SEGREGATE_OPTIONS_KEY, {})
+    while stack:
+        data, updates, parent, parent_key = stack.pop()
 
-    for key_to_remove in segregate_options.get("remove_keys", []):
-        data.pop(key_to_remove, None)
+        if not isinstance(updates, dict):
+            parent[parent_key] = updates
+            continue
 
-    if segregate_options.get("disable_nested_update", False):
-        return updates
+        segregate_options: SegregateOptions = updates.pop(SEGREGATE_OPTIONS_KEY, {})
 
-    for key, value in updates.items():
-        current_value = data.get(key)
+        for key_to_remove in segregate_options.get("remove_keys", []):
+            data.pop(key_to_remove, None)
 
-        if isinstance(current_value, dict):
-            data[key] = update_nested_dict(current_value, value)
-        else:
-            data[key] = value
+        if segregate_options.get("disable_nested_update", False):
+            parent[parent_key] = updates
+            continue
 
-    return data
+        for key, value in updates.items():
+            current_value = data.get(key)
+
+            if isinstance(current_value, dict):
+                stack.append((current_value, value, data, key))
+            else:
+                data[key] = value
+
+        parent[parent_key] = data
+
+    return result[0]
+
+
+def merge_nested_dict(data: Any, updates: Any) -> Any:
+    """
+    Merges updates into a nested dictionary without mutating either of them.
 
+    Behaves like `update_nested_dict`, honoring the `SegregateOptions` found in `updates`, but builds new
+    dictionaries only along the paths where both sides are merged. Every other subtree of `data` and `updates`
+    is shared with the result rather than copied, so parsed data can be merged repeatedly without a deepcopy.
 
-def load_segregated_configs(data: Any) -> Any:
+    Args:
+        data (Any): The original dictionary.
+        updates (Any): The updates to apply, which can be a dictionary or another value.
+
+    Returns:
+        Any: The merged dictionary, or `updates` if it is not a dictionary.
     """
-    Recursively loads and processes configuration data that may contain file paths or nested structures.
+    result: List[Any] = [updates]
+    stack: List[Tuple[Any, Any, Any, Hashable]] = [(data, updates, result, 0)]
+
+    while stack:
+        data, updates, parent, parent_key = stack.pop()
+
+        if not isinstance(updates, dict):
+            parent[parent_key] = updates
+            continue
+
+        segregate_options: SegregateOptions = updates.get(SEGREGATE_OPTIONS_KEY, {})
+
+        if segregate_options.get("disable_nested_update", False):
+            if SEGREGATE_OPTIONS_KEY in updates:
+                updates = {key: value for key, value in updates.items() if key != SEGREGATE_OPTIONS_KEY}
+
+            parent[parent_key] = updates
+            continue
+
+        merged = dict(data)
+
+        for key_to_remove in segregate_options.get("remove_keys", []):
+            merged.pop(key_to_remove, None)
+
+        for key, value in updates.items():
+            if key == SEGREGATE_OPTIONS_KEY:
+                continue
+
+            current_value = merged.get(key)
+
+            if isinstance(current_value, dict):
+                stack.append((current_value, value, merged, key))
+            else:
+                merged[key] = value
+
+        parent[parent_key] = merged
+
+    return result[0]
+
+
+def load_segregated_configs(
+    data: Any,
+    context: Optional[ResolutionContext] = None,
+    origin: Optional[Union[str, PathLike[str], Path]] = None,
+) -> Any:
+    """
+    Loads and processes configuration data that may contain file paths or nested structures.
+
+    The data is walked with an explicit stack, so deeply nested configurations are not bound by the recursion
+    limit, and every reference is checked against the chain of files that led to it.
 
     Args:
         data (Any): The configuration data to be processed. It can be a string, dictionary, or a collection.
+        context (Optional[ResolutionContext]): Cache of already parsed files, a new one is used if omitted.
+        origin (Optional[Union[str, PathLike[str], Path]]): The file `data` was read from, if any, so that
+            references back to it are detected as cycles.
 
     Returns:
         Any: The processed configuration data, with file paths loaded and nested structures updated.
+
+    Raises:
+        IncludeCycleError: If a file references itself, directly or through other files.
+        IncludeLimitError: If the `max_depth` or `max_files` limit of the context is exceeded.
     """
-    if isinstance(data, str) and data.startswith(PATH_PREFIX) and data.endswith(PATH_SUFFIX):
-        data = data[len(PATH_PREFIX) :]
-        data = data[: -len(PATH_SUFFIX)]
-        trimmed_path = data.strip()
-        data = read_file(trimmed_path)
+    if context is None:
+        context = ResolutionContext()
 
-    if isinstance(data, dict):
-        return {key: load_segregated_configs(value) for key, value in data.items()}
+    root_chain: Tuple[Path, ...] = () if origin is None else (context.resolve(origin),)
+    resolved_files = 0
+    result: List[Any] = [None]
+    stack: List[Tuple[Any, Any, Hashable, Tuple[Path, ...]]] = [(data, result, 0, root_chain)]
 
-    elif isinstance(data, (list, tuple, set, frozenset)):
-        return [load_segregated_configs(item) for item in data]
+    while stack:
+        data, parent, parent_key, chain = stack.pop()
+        trimmed_path = parse_reference(data)
 
-    return data
+        if trimmed_path is not None:
+            chain, path_to_file = _follow_reference(context, chain, trimmed_path, len(root_chain))
+            resolved_files += 1
+
+            if context.max_files is not None and resolved_files > context.max_files:
+                raise IncludeLimitError(f"More than `max_files` of {context.max_files} references were resolved.")
+
+            data = _read_reference(context, chain, path_to_file)
+
+        if isinstance(data, dict):
+            container: Any = dict.fromkeys(data)
+            items: Iterable[Tuple[Hashable, Any]] = data.items()
+        elif isinstance(data, (list, tuple, set, frozenset)):
+            container = [None] * len(data)
+            items = enumerate(data)
+        else:
+            parent[parent_key] = data
+            continue
+
+        parent[parent_key] = container
+        nested = []
+
+        for key, value in items:
+            if isinstance(value, (dict, list, tuple, set, frozenset)) or parse_reference(value) is not None:
+                nested.append((value, container, key, chain))
+            else:
+                container[key] = value
+
+        stack.extend(reversed(nested))
+
+    return result[0]
 
 
 def load_base_config(data: Dict[Hashable, Any]) -> Dict[Hashable, Any]:
     """
     Processes a configuration dictionary by applying the base configuration specified under `BASE_CONFIG_KEY`.
 
+    Nested dictionaries are processed before the dictionaries containing them, using an explicit stack rather
+    than recursion.
+
     Args:
         data (Dict[Hashable, Any]): The configuration dictionary to be processed.
 
     Returns:
         Dict[Hashable, Any]: The processed configuration dictionary with the base configuration applied.
     """
-    for key, value in data.items():
-        if isinstance(value, dict):
-            data[key] = load_base_config(value)
+    result: List[Any] = [data]
+    stack: List[Tuple[Any, Hashable, Dict[Hashable, Any], int]] = [(result, 0, data, 0)]
+    ordered = []
+
+    while stack:
+        parent, parent_key, nested_data, depth = stack.pop()
+        ordered.append((parent, parent_key, nested_data, depth))
+        stack.extend(
+            (nested_data, key, value, depth + 1) for key, value in nested_data.items() if isinstance(value, dict)
+        )
+
+    # Reversed pre-order visits every dictionary after all the dictionaries nested inside it.
+    for parent, parent_key, nested_data, depth in reversed(ordered):
+        base_data = nested_data.pop(BASE_CONFIG_KEY, None)
+
+        if base_data is not None:
+            start = perf_counter() if OBSERVERS else 0.0
+            nested_data = merge_nested_dict(base_data, nested_data)
+
+            if OBSERVERS:
+                keys = len(nested_data) if isinstance(nested_data, dict) else 0
+                notify(ProfileEvent("merge", None, perf_counter() - start, keys=keys, depth=depth))
+
+        parent[parent_key] = nested_data
+
+    processed_data: Dict[Hashable, Any] = result[0]
+
+    return processed_data
+
+
+def resolve_config(
+    data: Any,
+    context: Optional[ResolutionContext] = None,
+    origin: Optional[Union[str, PathLike[str], Path]] = None,
+    copy: bool = True,
+) -> Any:
+    """
+    Loads the references of configuration data and applies its base configurations in a single traversal.
+
+    Produces the same result as `load_base_config(load_segregated_configs(data, context, origin))`, but every
+    dictionary is merged with its `__base__` as soon as its values are processed, so the tree is walked once and
+    never rebuilt by the merges. Like `load_segregated_configs`, it uses an explicit stack rather than recursion.
+
+    Args:
+        data (Any): The configuration data to be processed.
+        context (Optional[ResolutionContext]): Cache of already parsed files, a new one is used if omitted.
+        origin (Optional[Union[str, PathLike[str], Path]]): The file `data` was read from, if any, so that
+            references back to it are detected as cycles.
+        copy (bool): Build an independent tree, which can be freely mutated. Otherwise new containers are only
+            built along the paths where references are loaded or bases are merged, and every other subtree is
+            shared with `data` and the parsed files of `context`, so the result must be treated as read-only.
+            Shared subtrees are kept as they are, so they may hold tuples or sets where a copy has lists.
+
+    Returns:
+        Any: The processed configuration data.
+
+    Raises:
+        IncludeCycleError: If a file references itself, directly or through other files.
+        IncludeLimitError: If the `max_depth` or `max_files` limit of the context is exceeded.
+    """
+    if context is None:
+        context = ResolutionContext()
+
+    root_chain: Tuple[Path, ...] = () if origin is None else (context.resolve(origin),)
+
+    return _resolve_config(data, context, root_chain, copy, None)
+
+
+def _resolve_config(
+    data: Any,
+    context: ResolutionContext,
+    root_chain: Tuple[Path, ...],
+    copy: bool,
+    memo: Optional[Dict[Tuple[Path, bool], Any]],
+) -> Any:
+    # Implements `resolve_config`. With `memo`, the processed value of a referenced file is taken from it if present,
+    # and stored in it otherwise, keyed on the resolved path of the file and whether it is below a list, where bases
+    # are not applied. `ConfigGraph` keeps the values of unchanged files there between refreshes.
+    resolved_files = 0
+    result: List[Any] = [None]
+    # Every value is visited, storing the processed value in `parent[parent_key]`, and containers are finished once
+    # all of their values are: dictionaries are merged with their base and, without `copy`, unchanged containers are
+    # replaced by the original. The depth of a dictionary is `None` below a list, where bases are not applied, as in
+    # `load_base_config`. Large containers are only scanned for references if no container above them in the same
+    # file was, so every value is serialized at most once per reference and nested scans don't add up. The last item
+    # is `True` to finish a container, or the key a finished value is stored under in `memo`.
+    stack: List[Tuple[Any, Any, Hashable, Tuple[Path, ...], Optional[int], bool, Union[bool, Tuple[Path, bool]]]] = [
+        (data, result, 0, root_chain, 0, True, False)
+    ]
+
+    while stack:
+        data, parent, parent_key, chain, depth, scan, finish = stack.pop()
+
+        if finish is True:
+            _finish_container(data, parent, parent_key, depth, copy)
+            continue
+
+        if finish:
+            if memo is not None:
+                memo[finish] = parent[parent_key]
+
+            continue
+
+        trimmed_path = parse_reference(data)
+
+        if trimmed_path is not None:
+            chain, path_to_file = _follow_reference(context, chain, trimmed_path, len(root_chain))
+            resolved_files += 1
+
+            if context.max_files is not None and resolved_files > context.max_files:
+                raise IncludeLimitError(f"More than `max_files` of {context.max_files} references were resolved.")
+
+            if memo is not None:
+                memo_key = (chain[-1], depth is None)
+
+                if memo_key in memo:
+                    parent[parent_key] = memo[memo_key]
+                    continue
 
-    base_data = data.pop(BASE_CONFIG_KEY, None)
+                # Popped once everything the file holds is processed, which is pushed above it.
+                stack.append((None, parent, parent_key, chain, depth, scan, memo_key))
 
-    if base_data is not None:
-        data = update_nested_dict(base_data, data)
+            data = _read_reference(context, chain, path_to_file)
+            scan = True
+
+        if isinstance(data, dict):
+            items: Iterable[Tuple[Hashable, Any]] = data.items()
+            nested_depth = None if depth is None else depth + 1
+            merge = depth is not None and BASE_CONFIG_KEY in data
+        elif isinstance(data, (list, tuple, set, frozenset)):
+            items = enumerate(data)
+            nested_depth = None
+            merge = False
+        else:
+            parent[parent_key] = data
+            continue
+
+        if scan and len(data) >= REFERENCE_SCAN_THRESHOLD and isinstance(data, (dict, list)):
+            if not _may_contain_references(data):
+                parent[parent_key] = _copy_resolved(data) if copy else data
+                continue
+
+            scan = False
+
+        # Inlined `parse_reference`, as this runs for every scalar of the tree.
+        nested = [
+            (value, key)
+            for key, value in items
+            if isinstance(value, (dict, list, tuple, set, frozenset))
+            or (isinstance(value, str) and value.startswith(PATH_PREFIX) and value.endswith(PATH_SUFFIX))
+        ]
+
+        if not copy and not nested and not merge and isinstance(data, (dict, list)):
+            parent[parent_key] = data
+            continue
+
+        # Values that need processing are overwritten when they are visited.
+        container = dict(data) if isinstance(data, dict) else list(data)
+        parent[parent_key] = container
+
+        if merge or not copy:
+            stack.append((data, parent, parent_key, chain, depth, scan, True))
+
+        stack.extend((value, container, key, chain, nested_depth, scan, False) for value, key in reversed(nested))
+
+    return result[0]
+
+
+def _may_contain_references(data: Any) -> bool:
+    # Serializing in C is an order of magnitude faster than walking the data in Python, and JSON never escapes the
+    # reference prefix nor the base key, so data without either of them has nothing to load or merge.
+    try:
+        content = _dumps_json(data)
+    except Exception:
+        # Data the JSON backend can't serialize, e.g. sets or custom objects, is simply walked.
+        return True
+
+    return _REFERENCE_MARKER in content or _BASE_MARKER in content
+
+
+_REFERENCE_MARKER = PATH_PREFIX.encode()
+_BASE_MARKER = f'"{BASE_CONFIG_KEY}"'.encode()
+
+
+def _copy_resolved(data: Any) -> Any:
+    # Copies like the traversal of `resolve_config` does, turning tuples and sets into lists.
+    if isinstance(data, dict):
+        return {key: _copy_resolved(value) for key, value in data.items()}
+
+    if isinstance(data, (list, tuple, set, frozenset)):
+        return [_copy_resolved(item) for item in data]
 
     return data
 
 
-def load_config(path_to_file: Union[str, PathLike[str], Path]) -> Dict[Hashable, Any]:
+def _finish_container(original: Any, parent: Any, parent_key: Hashable, depth: Optional[int], copy: bool) -> None:
+    container = parent[parent_key]
+
+    if isinstance(container, dict) and depth is not None and BASE_CONFIG_KEY in container:
+        base_data = container.pop(BASE_CONFIG_KEY)
+
+        if base_data is not None:
+            start = perf_counter() if OBSERVERS else 0.0
+            # A copied base was built by this traversal alone, so it can be updated in place.
+            container = update_nested_dict(base_data, container) if copy else merge_nested_dict(base_data, container)
+
+            if OBSERVERS:
+                keys = len(container) if isinstance(container, dict) else 0
+                notify(ProfileEvent("merge", None, perf_counter() - start, keys=keys, depth=depth))
+
+        parent[parent_key] = container
+    elif (
+        not copy
+        and type(original) is type(container)
+        and all(value is original_value for value, original_value in zip(_values(container), _values(original)))
+    ):
+        parent[parent_key] = original
+
+
+def _values(container: Any) -> Iterable[Any]:
+    values: Iterable[Any] = container.values() if isinstance(container, dict) else container
+    return values
+
+
+def _follow_reference(
+    context: ResolutionContext, chain: Tuple[Path, ...], trimmed_path: str, root_depth: int
+) -> Tuple[Tuple[Path, ...], Path]:
+    path_to_file = context.locate(trimmed_path, chain[-1] if chain else None)
+    path = context.resolve(path_to_file)
+
+    if path in chain:
+        raise IncludeCycleError(chain[chain.index(path) :] + (path,))
+
+    chain += (path,)
+
+    if context.max_depth is not None and len(chain) - root_depth > context.max_depth:
+        raise IncludeLimitError(
+            f"References are nested deeper than `max_depth` of {context.max_depth}: "
+            + " -> ".join(f"`{path}`" for path in chain)
+        )
+
+    return chain, path_to_file
+
+
+def _read_reference(
+    context: ResolutionContext, chain: Tuple[Path, ...], path_to_file: Union[str, PathLike[str], Path]
+) -> Any:
+    if not OBSERVERS:
+        return context.read(path_to_file)
+
+    start = perf_counter()
+    data = context.read(path_to_file)
+    notify(ProfileEvent("resolve", chain[-1], perf_counter() - start, depth=len(chain) - 1, chain=chain))
+
+    return data
+
+
+class LazyConfig(Mapping[Hashable, Any], ABC):
+    """
+    Read-only view of a processed configuration that resolves references only when they are accessed.
+
+    A `${{ path }}` reference is read, and the `__base__` chain of a dictionary is merged, only when one of its keys
+    is first looked up; the result is memoized. Listing the keys of a dictionary needs its `__base__` chain, but none
+    of the other references nested inside it. Lists are resolved eagerly when they are accessed.
+    """
+
+    def __init__(self, context: ResolutionContext, chain: Tuple[Path, ...]) -> None:
+        self._context = context
+        self._chain = chain
+        self._keys: Optional[List[Hashable]] = None
+        self._key_lookup: Optional[Dict[Hashable, None]] = None
+        self._values: Dict[Hashable, Any] = dict()
+
+    def __getitem__(self, key: Hashable) -> Any:
+        if key not in self._values:
+            if key not in self._key_set():
+                raise KeyError(key)
+
+            self._values[key] = self._compute(key)
+
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._key_list())
+
+    def __len__(self) -> int:
+        return len(self._key_list())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._key_set()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.materialize()!r})"
+
+    def materialize(self) -> Dict[Hashable, Any]:
+        """
+        Resolves every remaining reference.
+
+        Returns:
+            Dict[Hashable, Any]: The processed configuration as a plain dictionary, equal to the one `load_config`
+                returns without `lazy`.
+        """
+        result: Dict[Hashable, Any] = dict()
+        # Nested configurations are filled in from an explicit stack, so deep trees don't hit the recursion limit.
+        stack: List[Tuple[LazyConfig, Dict[Hashable, Any]]] = [(self, result)]
+
+        while stack:
+            config, materialized = stack.pop()
+
+            for key, value in config.items():
+                if isinstance(value, LazyConfig):
+                    materialized[key] = dict()
+                    stack.append((value, materialized[key]))
+                else:
+                    materialized[key] = value
+
+        return result
+
+    def _key_list(self) -> List[Hashable]:
+        if self._keys is None:
+            self._keys = self._compute_keys()
+
+        return self._keys
+
+    def _key_set(self) -> Dict[Hashable, None]:
+        if self._key_lookup is None:
+            self._key_lookup = dict.fromkeys(self._key_list())
+
+        return self._key_lookup
+
+    @abstractmethod
+    def _compute_keys(self) -> List[Hashable]:
+        """Lists the keys of the dictionary, in order."""
+
+    @abstractmethod
+    def _compute(self, key: Hashable) -> Any:
+        """Computes the value of one of the keys."""
+
+
+class _LazyDict(LazyConfig):
+    """A dictionary of the configuration, without its `__base__` chain."""
+
+    def __init__(self, context: ResolutionContext, chain: Tuple[Path, ...], data: Dict[Hashable, Any]) -> None:
+        super().__init__(context, chain)
+        self._data = data
+
+    def _compute_keys(self) -> List[Hashable]:
+        return list(self._data)
+
+    def _compute(self, key: Hashable) -> Any:
+        return _lazy_value(self._context, self._chain, self._data[key])
+
+
+class _LazyMerge(LazyConfig):
+    """The result of `update_nested_dict` applied to a base and an update, both already processed."""
+
+    def __init__(
+        self,
+        context: ResolutionContext,
+        chain: Tuple[Path, ...],
+        base: Mapping[Hashable, Any],
+        updates: Mapping[Hashable, Any],
+    ) -> None:
+        super().__init__(context, chain)
+        self._base = base
+        self._updates = updates
+        segregate_options = updates.get(SEGREGATE_OPTIONS_KEY, {})
+        self._remove_keys = list(segregate_options.get("remove_keys", []))
+        self._disable_nested_update = bool(segregate_options.get("disable_nested_update", False))
+
+    def _compute_keys(self) -> List[Hashable]:
+        # The keys of the bases are listed from the end of the `__base__` chain, so long chains don't hit the recursion
+        # limit.
+        bases: List[_LazyMerge] = []
+        base = self._base
+
+        while isinstance(base, _LazyMerge) and base._keys is None:
+            bases.append(base)
+            base = base._base
+
+        for base in reversed(bases):
+            base._key_list()
+
+        update_keys = [key for key in self._updates if key != SEGREGATE_OPTIONS_KEY]
+
+        if self._disable_nested_update:
+            return update_keys
+
+        keys = [key for key in self._base if key not in self._remove_keys]
+        known_keys = set(keys)
+
+        return keys + [key for key in update_keys if key not in known_keys]
+
+    def _compute(self, key: Hashable) -> Any:
+        # The value is first computed by the bases it is taken from, starting from the end of the `__base__` chain,
+        # so long chains don't hit the recursion limit.
+        bases: List[_LazyMerge] = []
+        merge = self
+
+        while isinstance(merge._base, _LazyMerge) and key not in merge._base._values and merge._needs_base(key):
+            merge = merge._base
+            bases.append(merge)
+
+        for merge in reversed(bases):
+            merge[key]
+
+        # The options of the updates only steer the merge, like `merge_nested_dict` the result keeps the base ones.
+        if key == SEGREGATE_OPTIONS_KEY or key not in self._updates:
+            return self._base[key]
+
+        value = self._updates[key]
+
+        if self._in_base(key) and isinstance(value, Mapping):
+            current_value = self._base[key]
+
+            if isinstance(current_value, Mapping):
+                return _LazyMerge(self._context, self._chain, current_value, value)
+
+        return value
+
+    def _in_base(self, key: Hashable) -> bool:
+        return not self._disable_nested_update and key in self._base and key not in self._remove_keys
+
+    def _needs_base(self, key: Hashable) -> bool:
+        # Whether `_compute` looks the key up in the base, which is only done where it can't be avoided.
+        if key == SEGREGATE_OPTIONS_KEY or key not in self._updates:
+            return True
+
+        return self._in_base(key) and isinstance(self._updates[key], Mapping)
+
+
+def _lazy_config(context: ResolutionContext, chain: Tuple[Path, ...], data: Dict[Hashable, Any]) -> LazyConfig:
+    # The `__base__` chain is followed to its end before the merges are built from there, so long chains don't hit
+    # the recursion limit.
+    layers: List[Tuple[Tuple[Path, ...], _LazyDict]] = []
+
+    while True:
+        own_data = _LazyDict(context, chain, {key: value for key, value in data.items() if key != BASE_CONFIG_KEY})
+        base_data = data.get(BASE_CONFIG_KEY)
+
+        if base_data is None:
+            base: Any = own_data
+            break
+
+        layers.append((chain, own_data))
+        trimmed_path = parse_reference(base_data)
+
+        if trimmed_path is not None:
+            chain, path_to_file = _follow_reference(context, chain, trimmed_path, 1)
+            base_data = _read_reference(context, chain, path_to_file)
+
+            if isinstance(base_data, str):
+                base = base_data
+                break
+
+        if not isinstance(base_data, dict):
+            base = load_segregated_configs(base_data, context, chain[-1] if chain else None)
+            break
+
+        data = base_data
+
+    for layer_chain, own_data in reversed(layers):
+        base = _LazyMerge(context, layer_chain, base, own_data)
+
+    config: LazyConfig = base
+    return config
+
+
+def _lazy_value(context: ResolutionContext, chain: Tuple[Path, ...], data: Any) -> Any:
+    trimmed_path = parse_reference(data)
+
+    if trimmed_path is not None:
+        chain, path_to_file = _follow_reference(context, chain, trimmed_path, 1)
+        data = _read_reference(context, chain, path_to_file)
+
+        if not isinstance(data, dict):
+            return data if isinstance(data, str) else load_segregated_configs(data, context, chain[-1])
+
+    if isinstance(data, dict):
+        return _lazy_config(context, chain, data)
+
+    return load_segregated_configs(data, context, chain[-1] if chain else None)
+
+
+def _as_key_path(key_path: Union[str, KeyPath]) -> KeyPath:
+    # Dotted strings are split into keys, tuples of keys are taken as they are.
+    return tuple(key_path.split(".")) if isinstance(key_path, str) else tuple(key_path)
+
+
+def _select_key_paths(config: LazyConfig, select: Iterable[Union[str, KeyPath]]) -> Dict[Hashable, Any]:
+    # Shorter key paths come first, so a section selected as a whole is never replaced by one of its parts.
+    key_paths = sorted((_as_key_path(key_path) for key_path in select), key=len)
+    selected: Dict[Hashable, Any] = dict()
+    partial_sections: Set[int] = set()
+
+    for key_path in key_paths:
+        if not key_path:
+            raise ValueError("Selected key paths can't be empty.")
+
+        value: Any = config
+
+        for index, key in enumerate(key_path):
+            if not isinstance(value, Mapping) or key not in value:
+                raise KeyError(key_path[: index + 1])
+
+            value = value[key]
+
+        section = selected
+
+        for key in key_path[:-1]:
+            if key not in section:
+                section[key] = dict()
+                partial_sections.add(id(section[key]))
+            elif id(section[key]) not in partial_sections:
+                break
+
+            section = section[key]
+        else:
+            section[key_path[-1]] = value.materialize() if isinstance(value, LazyConfig) else value
+
+    return selected
+
+
+@overload
+def load_config(
+    path_to_file: Union[str, PathLike[str], Path],
+    context: Optional[ResolutionContext] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    snapshot: Optional[Union[str, PathLike[str], Path]] = None,
+    lazy: Literal[False] = False,
+    frozen: Literal[False] = False,
+    select: Optional[Iterable[Union[str, KeyPath]]] = None,
+) -> Dict[Hashable, Any]: ...
+
+
+@overload
+def load_config(
+    path_to_file: Union[str, PathLike[str], Path],
+    context: Optional[ResolutionContext] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    snapshot: Optional[Union[str, PathLike[str], Path]] = None,
+    *,
+    lazy: Literal[True],
+) -> LazyConfig: ...
+
+
+@overload
+def load_config(
+    path_to_file: Union[str, PathLike[str], Path],
+    context: Optional[ResolutionContext] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    snapshot: Optional[Union[str, PathLike[str], Path]] = None,
+    lazy: Literal[False] = False,
+    *,
+    frozen: Literal[True],
+    select: Optional[Iterable[Union[str, KeyPath]]] = None,
+) -> FrozenDict: ...
+
+
+def load_config(
+    path_to_file: Union[str, PathLike[str], Path],
+    context: Optional[ResolutionContext] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    snapshot: Optional[Union[str, PathLike[str], Path]] = None,
+    lazy: bool = False,
+    frozen: bool = False,
+    select: Optional[Iterable[Union[str, KeyPath]]] = None,
+) -> Union[Dict[Hashable, Any], LazyConfig, FrozenDict]:
     """
     Loads and processes a configuration file.
 
     Args:
         path_to_file (Union[str, PathLike[str], Path]): The path to the configuration file.
+        context (Optional[ResolutionContext]): Cache of already parsed files. Pass the same context to several
+            calls to share parsed files between them, a new one is used if omitted.
+        executor (Optional[Executor]): Executor used to read and parse the referenced files concurrently before
+            assembling the configuration. The result is the same as with sequential reads.
+        max_workers (Optional[int]): Number of threads used to read the referenced files concurrently, when no
+            `executor` is given. Files are read sequentially if both are omitted.
+        snapshot (Optional[Union[str, PathLike[str], Path]]): Path to a `.snapshot` file. If it holds an up-to-date
+            snapshot of this configuration, it is returned without reading, resolving or merging any file.
+            Otherwise the configuration is loaded as usual and the snapshot is (re)written.
+        lazy (bool): Return a `LazyConfig` that reads referenced files only when their keys are first accessed.
+            Can't be combined with `executor`, `max_workers` or `snapshot`, which need the whole tree.
+        frozen (bool): Return a `FrozenDict` built with `freeze`, which can be shared between threads without
+            copying. Equal sections, e.g. inherited from a common `__base__`, are stored once. Can't be combined
+            with `lazy`.
+        select (Optional[Iterable[Union[str, KeyPath]]]): Key paths of the only sections to load, either dotted
+            strings like `"services.database"` or tuples of keys. Only the files of the root `__base__` chain and
+            the files referenced under the selected sections are read. The result holds the selected sections at
+            their original key paths. Can't be combined with `lazy`, `executor`, `max_workers` or `snapshot`.
 
     Returns:
-        Dict[Hashable, Any]: The processed configuration dictionary.
+        Union[Dict[Hashable, Any], LazyConfig, FrozenDict]: The processed configuration dictionary, a lazy view
+            of it, or its frozen version.
+
+    Raises:
+        ValueError: If `lazy` is combined with `executor`, `max_workers`, `snapshot`, `frozen` or `select`, or if
+            `select` is combined with `executor`, `max_workers` or `snapshot`.
+        KeyError: If a selected key path does not exist in the configuration.
     """
-    data: Dict[Hashable, Any] = read_file(path_to_file)
-    data = load_segregated_configs(data)
-    data = load_base_config(data)
+    if lazy and (executor is not None or max_workers is not None or snapshot is not None or frozen):
+        raise ValueError("`lazy` can't be combined with `executor`, `max_workers`, `snapshot` or `frozen`.")
+
+    if select is not None and (lazy or executor is not None or max_workers is not None or snapshot is not None):
+        raise ValueError("`select` can't be combined with `lazy`, `executor`, `max_workers` or `snapshot`.")
+
+    start = perf_counter() if OBSERVERS else 0.0
+
+    if snapshot is not None:
+        snapshot_data = load_snapshot(snapshot, path_to_file)
+
+        if snapshot_data is not None:
+            snapshot_config: Union[Dict[Hashable, Any], FrozenDict] = freeze(snapshot_data) if frozen else snapshot_data
+
+            if OBSERVERS:
+                notify(ProfileEvent("load", Path(path_to_file), perf_counter() - start))
+
+            return snapshot_config
+
+    if context is None:
+        context = ResolutionContext()
+
+    if executor is not None:
+        context.prefetch([path_to_file], executor)
+    elif max_workers is not None:
+        with ThreadPoolExecutor(max_workers) as thread_executor:
+            context.prefetch([path_to_file], thread_executor)
+
+    root_chain = (context.resolve(path_to_file),)
+    data: Dict[Hashable, Any] = _read_reference(context, root_chain, path_to_file)
+
+    if lazy:
+        lazy_config = _lazy_config(context, root_chain, data)
+
+        if OBSERVERS:
+            notify(ProfileEvent("load", Path(path_to_file), perf_counter() - start))
+
+        return lazy_config
+
+    if select is not None:
+        data = _select_key_paths(_lazy_config(context, root_chain, data), select)
+    else:
+        data = resolve_config(data, context, path_to_file, copy=not frozen)
+
+    if snapshot is not None:
+        save_snapshot(snapshot, path_to_file, data, context.files, context._read_stats)
+
+    if frozen:
+        data = freeze(data)
+
+    if OBSERVERS:
+        notify(ProfileEvent("load", Path(path_to_file), perf_counter() - start))
 
     return data
+
+
+def load_configs(
+    paths_to_files: Iterable[Union[str, PathLike[str], Path]],
+    context: Optional[ResolutionContext] = None,
+    executor: Optional[Executor] = None,
+    chunksize: int = 64,
+    max_pending: Optional[int] = None,
+    maxsize: Optional[int] = 128,
+    maxbytes: Optional[int] = None,
+) -> Iterator[Tuple[Union[str, PathLike[str], Path], Dict[Hashable, Any]]]:
+    """
+    Loads and processes many configuration files, yielding each one as soon as it is ready.
+
+    Referenced files (e.g. a shared `__base__` chain) are kept in a cache bounded by `maxsize` and `maxbytes`, which
+    evicts the least recently used files first, so files shared by configurations spread across the batch are parsed
+    once rather than once per configuration. The root files themselves are rarely shared and are not kept. As
+    `paths_to_files` is consumed lazily, memory stays bounded by the cache and the pending results regardless of the
+    size of the batch.
+
+    Args:
+        paths_to_files (Iterable[Union[str, PathLike[str], Path]]): The paths to the configuration files.
+        context (Optional[ResolutionContext]): Cache of parsed files shared by the batch, a new one is used if
+            omitted. With an `executor`, only its limits and `relative_to_file` are passed to the workers.
+        executor (Optional[Executor]): Executor loading chunks of the batch concurrently, e.g. a
+            `ProcessPoolExecutor` for CPU-heavy parsing. Each chunk shares its own cache of parsed files.
+            Configurations are loaded sequentially in the calling thread if omitted.
+        chunksize (int): Number of configurations loaded by one task of `executor`.
+        max_pending (Optional[int]): Maximum number of chunks submitted to `executor` and not yet yielded,
+            twice the number of CPUs if omitted.
+        maxsize (Optional[int]): Maximum number of referenced files kept between configurations, `None` for no
+            limit. With an `executor`, each chunk has its own cache.
+        maxbytes (Optional[int]): Maximum total on-disk size of the referenced files kept between configurations,
+            `None` for no limit.
+
+    Yields:
+        Tuple[Union[str, PathLike[str], Path], Dict[Hashable, Any]]: Each path, in the order of `paths_to_files`,
+            together with its processed configuration dictionary.
+    """
+    if context is None:
+        context = ResolutionContext()
+
+    if executor is None:
+        yield from _iter_configs(paths_to_files, context, maxsize, maxbytes)
+        return
+
+    if max_pending is None:
+        max_pending = 2 * (os.cpu_count() or 1)
+
+    paths_iterator = iter(paths_to_files)
+    pending: deque[Tuple[List[Union[str, PathLike[str], Path]], Future[List[Dict[Hashable, Any]]]]] = deque()
+
+    while True:
+        while len(pending) < max_pending:
+            chunk = list(islice(paths_iterator, chunksize))
+
+            if not chunk:
+                break
+
+            future = executor.submit(
+                _load_config_chunk,
+                chunk,
+                context.max_depth,
+                context.max_files,
+                context.relative_to_file,
+                maxsize,
+                maxbytes,
+            )
+            pending.append((chunk, future))
+
+        if not pending:
+            return
+
+        chunk, future = pending.popleft()
+        yield from zip(chunk, future.result())
+
+
+def _iter_configs(
+    paths_to_files: Iterable[Union[str, PathLike[str], Path]],
+    context: ResolutionContext,
+    maxsize: Optional[int],
+    maxbytes: Optional[int],
+) -> Iterator[Tuple[Union[str, PathLike[str], Path], Dict[Hashable, Any]]]:
+    # On-disk size of the files kept for the rest of the batch, from the least to the most recently used.
+    recent: OrderedDict[Path, int] = OrderedDict()
+    nbytes = 0
+
+    for path_to_file in paths_to_files:
+        context._used = set()
+
+        try:
+            config = load_config(path_to_file, context)
+        finally:
+            used_files, context._used = context._used, None
+
+        # Root files are rarely shared, so only the files they reference are worth keeping.
+        root = context.resolve(path_to_file)
+        used_files.discard(root)
+        context._parsed.pop(root, None)
+        context._read_stats.pop(root, None)
+        nbytes -= recent.pop(root, 0)
+
+        for key in used_files:
+            if key in recent:
+                recent.move_to_end(key)
+            else:
+                file_stat = context._read_stats.get(key)
+                recent[key] = 0 if file_stat is None else file_stat.st_size
+                nbytes += recent[key]
+
+        while recent and (
+            (maxsize is not None and len(recent) > maxsize) or (maxbytes is not None and nbytes > maxbytes)
+        ):
+            key, file_size = recent.popitem(last=False)
+            nbytes -= file_size
+            context._parsed.pop(key, None)
+            context._read_stats.pop(key, None)
+
+        yield path_to_file, config
+
+
+def _load_config_chunk(
+    paths_to_files: List[Union[str, PathLike[str], Path]],
+    max_depth: Optional[int],
+    max_files: Optional[int],
+    relative_to_file: bool,
+    maxsize: Optional[int],
+    maxbytes: Optional[int],
+) -> List[Dict[Hashable, Any]]:
+    context = ResolutionContext(max_depth, max_files, relative_to_file)
+
+    return [config for _, config in _iter_configs(paths_to_files, context, maxsize, maxbytes)]
+
+
+async def load_config_async(
+    path_to_file: Union[str, PathLike[str], Path],
+    context: Optional[ResolutionContext] = None,
+    max_concurrency: int = 16,
+) -> Dict[Hashable, Any]:
+    """
+    Loads and processes a configuration file without blocking the running event loop.
+
+    Files are read with `read_file_async`, gathering sibling references concurrently, and the configuration is
+    assembled once every referenced file has been read.
+
+    Args:
+        path_to_file (Union[str, PathLike[str], Path]): The path to the configuration file.
+        context (Optional[ResolutionContext]): Cache of already parsed files, a new one is used if omitted.
+        max_concurrency (int): Maximum number of files read at the same time.
+
+    Returns:
+        Dict[Hashable, Any]: The processed configuration dictionary.
+    """
+    if context is None:
+        context = ResolutionContext()
+
+    await context.prefetch_async([path_to_file], max_concurrency)
+
+    return load_config(path_to_file, context)
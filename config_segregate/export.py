@@ -0,0 +1,193 @@
+import os
+import pickle
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from os import PathLike
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Union
+
+from .core import BASE_CONFIG_KEY, PATH_PREFIX, PATH_SUFFIX, KeyPath, _as_key_path, parse_reference
+from .writers import _serialize, _write_file
+
+__all__ = [
+    "write_segregated",
+]
+
+
+def write_segregated(
+    config: Dict[Hashable, Any],
+    path_to_file: Union[str, PathLike[str], Path],
+    layout: Iterable[Union[str, KeyPath]],
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    relative_to_file: bool = False,
+    overwrite: bool = False,
+    atomic: bool = False,
+    skip_unchanged: bool = False,
+) -> Dict[Path, bool]:
+    """
+    Writes a configuration as a root file and sub-files linked with `${{ path }}` references, the inverse of
+    `load_config`.
+
+    Every section listed in `layout` is written to its own file next to `path_to_file`, named after the root file
+    and the key path of the section, e.g. `config.services.database.json`, and replaced by a reference to it.
+    Sections nested in other listed sections are referenced from the file of the closest one. Sections with the same
+    content are written once and their references share that file, which is named after the first of them.
+
+    The sub-files are written before the root file, so the root file never references a file that is not written
+    yet. Loading the root file with `load_config` returns `config` again.
+
+    Args:
+        config (Dict[Hashable, Any]): The processed configuration dictionary to write.
+        path_to_file (Union[str, PathLike[str], Path]): The path to the root file. The sub-files use its extension.
+        layout (Iterable[Union[str, KeyPath]]): Key paths of the sections written to their own files, either dotted
+            strings like `"services.database"` or tuples of keys. Each one must lead to a dictionary.
+        executor (Optional[Executor]): Executor used to write the sub-files concurrently.
+        max_workers (Optional[int]): Number of threads used to write the sub-files concurrently, when no
+            `executor` is given. Files are written sequentially if both are omitted.
+        relative_to_file (bool): Reference the sub-files by their name rather than by their absolute path, for
+            trees loaded with a `ResolutionContext` using `relative_to_file` that can be moved around.
+        overwrite (bool): Replace files that already exist, see `write_file`.
+        atomic (bool): Write every file atomically, see `write_file`.
+        skip_unchanged (bool): Leave files whose content would not change untouched, see `write_file`.
+
+    Returns:
+        Dict[Path, bool]: Every file of the tree, the root file first, mapped to `True` if it was written or `False`
+            if it was skipped as unchanged.
+
+    Raises:
+        KeyError: If a key path of `layout` does not exist in `config`.
+        ValueError: If a key path of `layout` is empty, does not lead to a dictionary or gives the same file name as
+            another one, or if `config` holds `${{ path }}` references or `__base__` keys, which would be resolved
+            when loading the files back.
+    """
+    path_to_file = Path(path_to_file)
+    _check_exportable(config)
+
+    key_paths = list(dict.fromkeys(_as_key_path(key_path) for key_path in layout))
+    # Each section is replaced by its reference in the closest listed section holding it, or in the root file.
+    nested_sections: Dict[KeyPath, List[KeyPath]] = {key_path: [] for key_path in [(), *key_paths]}
+
+    for key_path in key_paths:
+        if not key_path:
+            raise ValueError("Key paths of the layout can't be empty.")
+
+        if not isinstance(_section(config, key_path), dict):
+            raise ValueError(f"Key path `{key_path}` does not lead to a dictionary.")
+
+        holder_length = max(length for length in range(len(key_path)) if key_path[:length] in nested_sections)
+        nested_sections[key_path[:holder_length]].append(key_path)
+
+    references: Dict[KeyPath, str] = dict()
+    files: Dict[bytes, Path] = dict()
+    jobs: List[Tuple[Path, Dict[Hashable, Any], Optional[bytes]]] = []
+    jobs_files: Set[Path] = set()
+
+    # Deeper sections come first, so their references are known when the sections holding them are serialized.
+    for key_path in sorted(key_paths, key=len, reverse=True):
+        data = _replace_sections(config, key_path, nested_sections[key_path], references)
+        sub_file = path_to_file.with_name(_file_name(path_to_file, key_path))
+        content = _serialize(sub_file, data)
+        # Writers working on paths don't expose the content, identical pickles still mean identical sections.
+        content_key = content if content is not None else pickle.dumps(data)
+
+        if content_key not in files:
+            if sub_file == path_to_file or sub_file in jobs_files:
+                raise ValueError(f"Key path `{key_path}` gives the file name of another section: `{sub_file.name}`.")
+
+            files[content_key] = sub_file
+            jobs_files.add(sub_file)
+            jobs.append((sub_file, data, content))
+
+        reference_path = files[content_key].name if relative_to_file else str(files[content_key].resolve())
+        references[key_path] = f"{PATH_PREFIX} {reference_path} {PATH_SUFFIX}"
+
+    written: Dict[Path, bool] = dict()
+
+    if executor is None and max_workers is not None:
+        with ThreadPoolExecutor(max_workers) as thread_executor:
+            written.update(_write_files(jobs, thread_executor, overwrite, atomic, skip_unchanged))
+    else:
+        written.update(_write_files(jobs, executor, overwrite, atomic, skip_unchanged))
+
+    data = _replace_sections(config, (), nested_sections[()], references)
+
+    return {path_to_file: _write_file(path_to_file, data, None, overwrite, atomic, skip_unchanged), **written}
+
+
+def _check_exportable(config: Dict[Hashable, Any]) -> None:
+    stack: List[Any] = [config]
+
+    while stack:
+        value = stack.pop()
+
+        if isinstance(value, dict):
+            if BASE_CONFIG_KEY in value:
+                raise ValueError(f"Configurations holding `{BASE_CONFIG_KEY}` keys can't be written back as is.")
+
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif parse_reference(value) is not None:
+            raise ValueError(f"Configurations holding references like `{value}` can't be written back as is.")
+
+
+def _section(config: Dict[Hashable, Any], key_path: KeyPath) -> Any:
+    value: Any = config
+
+    for index, key in enumerate(key_path):
+        if not isinstance(value, dict) or key not in value:
+            raise KeyError(key_path[: index + 1])
+
+        value = value[key]
+
+    return value
+
+
+def _replace_sections(
+    config: Dict[Hashable, Any], key_path: KeyPath, nested_sections: List[KeyPath], references: Dict[KeyPath, str]
+) -> Dict[Hashable, Any]:
+    # Only the dictionaries leading to the replaced sections are copied, the rest of the section is shared.
+    data = dict(_section(config, key_path))
+    copies: Dict[KeyPath, Dict[Hashable, Any]] = {(): data}
+
+    for nested_path in nested_sections:
+        relative_path = nested_path[len(key_path) :]
+
+        for length in range(1, len(relative_path)):
+            if relative_path[:length] not in copies:
+                parent, key = copies[relative_path[: length - 1]], relative_path[length - 1]
+                copies[relative_path[:length]] = parent[key] = dict(parent[key])
+
+        copies[relative_path[:-1]][relative_path[-1]] = references[nested_path]
+
+    return data
+
+
+def _file_name(path_to_file: Path, key_path: KeyPath) -> str:
+    keys = [str(key) for key in key_path]
+
+    if any(not key or key in (".", "..") or "/" in key or os.sep in key for key in keys):
+        raise ValueError(f"Key path `{key_path}` can't be used in a file name.")
+
+    return ".".join([path_to_file.stem, *keys]) + path_to_file.suffix
+
+
+def _write_files(
+    jobs: List[Tuple[Path, Dict[Hashable, Any], Optional[bytes]]],
+    executor: Optional[Executor],
+    overwrite: bool,
+    atomic: bool,
+    skip_unchanged: bool,
+) -> Dict[Path, bool]:
+    if executor is None:
+        return {
+            path_to_file: _write_file(path_to_file, data, content, overwrite, atomic, skip_unchanged)
+            for path_to_file, data, content in jobs
+        }
+
+    futures: Dict[Path, Future[bool]] = {
+        path_to_file: executor.submit(_write_file, path_to_file, data, content, overwrite, atomic, skip_unchanged)
+        for path_to_file, data, content in jobs
+    }
+
+    return {path_to_file: future.result() for path_to_file, future in futures.items()}
@@ -0,0 +1,141 @@
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .cache import _IMMUTABLE_TYPES
+
+__all__ = [
+    "FrozenDict",
+    "freeze",
+]
+
+
+class FrozenDict(Mapping[Hashable, Any]):
+    """
+    Immutable, hashable mapping holding a frozen configuration.
+
+    Instances can be handed to any number of threads without copying. Build them from nested configuration data
+    with `freeze`, which also freezes the values.
+    """
+
+    __slots__ = ("_data", "_hash")
+
+    _data: Dict[Hashable, Any]
+    _hash: Optional[int]
+
+    def __init__(self, data: Optional[Mapping[Hashable, Any]] = None) -> None:
+        object.__setattr__(self, "_data", dict(data or ()))
+        object.__setattr__(self, "_hash", None)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
+        if isinstance(other, FrozenDict):
+            return self._data == other._data
+
+        # Other mappings are frozen as well, so lists compare equal to the tuples they were frozen into.
+        return isinstance(other, Mapping) and self._data == freeze(dict(other))._data
+
+    def __hash__(self) -> int:
+        value_hash = self._hash
+
+        if value_hash is None:
+            value_hash = hash(frozenset(self._data.items()))
+            object.__setattr__(self, "_hash", value_hash)
+
+        return value_hash
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"`{type(self).__name__}` is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"`{type(self).__name__}` is immutable.")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (self._data,))
+
+
+def freeze(data: Any) -> Any:
+    """
+    Converts configuration data into an immutable tree of `FrozenDict` and tuples.
+
+    Equal subtrees are interned, so sections repeated across the tree, e.g. inherited from a common `__base__`,
+    are stored once and shared. Values of different types are never interned together, even when they compare
+    equal, like `1` and `True`.
+
+    Args:
+        data (Any): The data to freeze, usually a processed configuration dictionary.
+
+    Returns:
+        Any: The frozen data. Dictionaries become `FrozenDict`, lists become tuples and scalars are kept as they are.
+    """
+    if not isinstance(data, (dict, list, tuple)):
+        return data
+
+    # Subtrees shared by the merge engine are frozen once, by identity, before equal ones are interned by value.
+    frozen: Dict[int, Any] = dict()
+    interned: Dict[Hashable, Any] = dict()
+    result: List[Any] = [None]
+    # Every container is visited, storing its frozen value in `parent[parent_key]`, and finished once all of its values
+    # are frozen. The explicit stack keeps deep trees from hitting the recursion limit.
+    stack: List[Tuple[Any, Any, Hashable, bool]] = [(data, result, 0, False)]
+
+    while stack:
+        value, parent, parent_key, finish = stack.pop()
+
+        if finish:
+            parent[parent_key] = frozen[id(value)] = _intern(interned, parent[parent_key])
+            continue
+
+        if id(value) in frozen:
+            parent[parent_key] = frozen[id(value)]
+            continue
+
+        # Scalars are kept as they are, nested containers are overwritten when they are visited.
+        items: Iterable[Tuple[Hashable, Any]] = value.items() if isinstance(value, dict) else enumerate(value)
+        container = dict(value) if isinstance(value, dict) else list(value)
+        parent[parent_key] = container
+        stack.append((value, parent, parent_key, True))
+        stack.extend((item, container, key, False) for key, item in items if isinstance(item, (dict, list, tuple)))
+
+    return result[0]
+
+
+def _intern(interned: Dict[Hashable, Any], container: Any) -> Any:
+    signature: Hashable
+
+    if isinstance(container, dict):
+        signature = (dict, tuple((_tag(key), _tag(item)) for key, item in container.items()))
+        result = interned.get(signature)
+
+        if result is None:
+            result = interned[signature] = FrozenDict(container)
+
+        return result
+
+    values = tuple(container)
+    signature = (tuple, tuple(_tag(item) for item in values))
+    return interned.setdefault(signature, values)
+
+
+def _tag(value: Any) -> Hashable:
+    # Containers are interned bottom-up, so equal frozen children are already the same object.
+    if not isinstance(value, _IMMUTABLE_TYPES):
+        return id(value)
+
+    # `0.0 == -0.0`, so floats are compared on their exact representation.
+    return (type(value), value.hex() if isinstance(value, float) else value)
@@ -0,0 +1,228 @@
+import os
+from os import PathLike
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .core import KeyPath, ResolutionContext, _resolve_config, find_references
+from .readers import _signature as _stat_signature
+
+__all__ = [
+    "RefreshResult",
+    "ConfigGraph",
+    "diff_configs",
+]
+
+
+class RefreshResult(NamedTuple):
+    """The outcome of `ConfigGraph.refresh`."""
+
+    config: Dict[Hashable, Any]
+    """The processed configuration dictionary."""
+    changed: List[KeyPath]
+    """Key paths whose value was added, removed or modified by the refresh."""
+
+
+class _FileNode:
+    """A file of the include graph together with the references it holds."""
+
+    __slots__ = ("path", "signature", "references")
+
+    def __init__(self, path: Path, signature: Optional[Hashable], references: Dict[KeyPath, Path]) -> None:
+        self.path = path
+        self.signature = signature
+        """`os.stat` signature of the file taken before it was read, `None` once it must be read again."""
+        self.references = references
+
+
+class ConfigGraph:
+    """
+    Configuration loaded together with the include graph it was assembled from.
+
+    The graph records, for every file, which key paths reference other files (including `__base__` chains) and
+    memoizes the value each file contributes. `refresh` then re-reads only the files that changed on disk and
+    re-merges only the files that (transitively) reference them, reusing the memoized values of everything else.
+
+    Memoized values are shared with `config` rather than copied, so the configuration must be treated as read-only.
+    """
+
+    def __init__(self, path_to_file: Union[str, PathLike[str], Path], relative_to_file: bool = False) -> None:
+        """
+        Loads the configuration and records its include graph.
+
+        Args:
+            path_to_file (Union[str, PathLike[str], Path]): The path to the configuration file.
+            relative_to_file (bool): Resolve relative reference paths against the directory of the file containing
+                the reference instead of the current working directory, see `ResolutionContext`.
+        """
+        self._context = ResolutionContext(relative_to_file=relative_to_file)
+        self.root = self._context.resolve(path_to_file)
+        self._nodes: Dict[Path, _FileNode] = dict()
+        # Processed value of every referenced file, see `_resolve_config`.
+        self._values: Dict[Tuple[Path, bool], Any] = dict()
+        self.config: Dict[Hashable, Any] = self._evaluate()
+
+    @property
+    def files(self) -> List[Path]:
+        """Resolved paths of every file the configuration is assembled from."""
+        return list(self._nodes)
+
+    def references(self, path_to_file: Union[str, PathLike[str], Path]) -> Dict[KeyPath, Path]:
+        """
+        Lists the files referenced by one file of the graph.
+
+        Args:
+            path_to_file (Union[str, PathLike[str], Path]): The path to a file of the graph.
+
+        Returns:
+            Dict[KeyPath, Path]: Resolved paths of the referenced files, keyed on the key path of the reference
+                inside the file. A `__base__` reference ends with `BASE_CONFIG_KEY`.
+        """
+        return dict(self._nodes[self._context.resolve(path_to_file)].references)
+
+    def dirty_files(self) -> Set[Path]:
+        """
+        Finds the files of the graph that changed on disk since they were read.
+
+        Returns:
+            Set[Path]: Resolved paths of the files whose modification time, size or inode changed, or that no
+                longer exist.
+        """
+        dirty = set()
+
+        for path, node in self._nodes.items():
+            try:
+                signature = _signature(path)
+            except OSError:
+                signature = None
+
+            if node.signature is None or signature != node.signature:
+                dirty.add(path)
+
+        return dirty
+
+    def refresh(self) -> RefreshResult:
+        """
+        Reloads the configuration, re-reading only the files that changed on disk.
+
+        Returns:
+            RefreshResult: The processed configuration and the key paths that changed.
+        """
+        dirty = self.dirty_files()
+
+        if not dirty:
+            return RefreshResult(self.config, [])
+
+        for path in self._with_ancestors(dirty):
+            self._values.pop((path, False), None)
+            self._values.pop((path, True), None)
+
+            if path in dirty:
+                self._nodes[path].signature = None
+                self._context._parsed.pop(path, None)
+                self._context._read_stats.pop(path, None)
+
+        previous_config, self.config = self.config, self._evaluate()
+        self._prune()
+
+        return RefreshResult(self.config, diff_configs(previous_config, self.config))
+
+    def _with_ancestors(self, paths: Set[Path]) -> Set[Path]:
+        parents: Dict[Path, Set[Path]] = dict()
+
+        for node in self._nodes.values():
+            for reference in node.references.values():
+                parents.setdefault(reference, set()).add(node.path)
+
+        found = set(paths)
+        pending = list(paths)
+
+        while pending:
+            for parent in parents.get(pending.pop(), ()):
+                if parent not in found:
+                    found.add(parent)
+                    pending.append(parent)
+
+        return found
+
+    def _prune(self) -> None:
+        reachable = {self.root}
+        pending = [self.root]
+
+        while pending:
+            for reference in self._nodes[pending.pop()].references.values():
+                if reference not in reachable:
+                    reachable.add(reference)
+                    pending.append(reference)
+
+        for path in set(self._nodes) - reachable:
+            del self._nodes[path]
+            self._context._parsed.pop(path, None)
+            self._context._read_stats.pop(path, None)
+            self._values.pop((path, False), None)
+            self._values.pop((path, True), None)
+
+    def _evaluate(self) -> Dict[Hashable, Any]:
+        # The values of unchanged files are taken from `_values` by the resolver instead of being processed again.
+        data = self._context.read(self.root)
+        config: Dict[Hashable, Any] = _resolve_config(data, self._context, (self.root,), False, self._values)
+
+        for path, raw in self._context._parsed.items():
+            node = self._nodes.get(path)
+
+            if node is None or node.signature is None:
+                references = {
+                    key_path: self._locate(trimmed_path, path) for key_path, trimmed_path in find_references(raw)
+                }
+                signature = _stat_signature(self._context._read_stats[path])
+                self._nodes[path] = _FileNode(path, signature, references)
+
+        return config
+
+    def _locate(self, trimmed_path: str, origin: Path) -> Path:
+        return self._context.resolve(self._context.locate(trimmed_path, origin))
+
+
+def diff_configs(old: Any, new: Any) -> List[KeyPath]:
+    """
+    Lists the key paths whose value differs between two configurations.
+
+    Args:
+        old (Any): The previous configuration.
+        new (Any): The current configuration.
+
+    Returns:
+        List[KeyPath]: Key paths that were added, removed or modified, descending into nested dictionaries.
+    """
+    return list(_diff(old, new, ()))
+
+
+def _diff(old: Any, new: Any, prefix: KeyPath) -> Iterator[KeyPath]:
+    # Items are `(old, new, prefix)` to compare, or `(None, None, prefix)` with `compare` unset for a key path that
+    # was added or removed. Nested dictionaries are compared from an explicit stack, in the order of their keys.
+    stack: List[Tuple[Any, Any, KeyPath, bool]] = [(old, new, prefix, True)]
+
+    while stack:
+        old, new, prefix, compare = stack.pop()
+
+        if not compare:
+            yield prefix
+            continue
+
+        if old is new:
+            continue
+
+        if not (isinstance(old, dict) and isinstance(new, dict)):
+            if old != new:
+                yield prefix
+            continue
+
+        items = [
+            (None, None, prefix + (key,), False) if key not in new else (old_value, new[key], prefix + (key,), True)
+            for key, old_value in old.items()
+        ]
+        items.extend((None, None, prefix + (key,), False) for key in new if key not in old)
+        stack.extend(reversed(items))
+
+
+def _signature(path: Path) -> Hashable:
+    return _stat_signature(os.stat(path))
@@ -0,0 +1,188 @@
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+__all__ = [
+    "ProfileEvent",
+    "ObserverFunc",
+    "add_observer",
+    "remove_observer",
+    "ProfileCollector",
+]
+
+
+class ProfileEvent(NamedTuple):
+    """A timed step of loading a configuration, reported to the observers."""
+
+    kind: str
+    """The step: `stat` and `read` (reading and parsing) of a file by `read_file`, `resolve` of a `${{ path }}`
+    reference, `merge` of a `__base__` configuration, or `load` of a whole configuration by `load_config`."""
+    path: Optional[Path]
+    """The file of the step, resolved for `resolve` events, `None` for `merge` events."""
+    elapsed: float
+    """Duration of the step, in seconds."""
+    nbytes: Optional[int] = None
+    """Size of the file, for `stat` and `read` events."""
+    keys: Optional[int] = None
+    """Number of keys of the merged dictionary, for `merge` events."""
+    depth: Optional[int] = None
+    """Number of nested references for `resolve` events, nesting level of the dictionary for `merge` events."""
+    chain: Tuple[Path, ...] = ()
+    """Resolved paths of the files leading to the reference, for `resolve` events."""
+
+
+ObserverFunc = Callable[[ProfileEvent], None]
+"""A type alias for observer functions, which receive every `ProfileEvent`."""
+
+
+OBSERVERS: List[ObserverFunc] = []
+"""Installed observers. Steps are only timed while it is not empty, which costs a single check otherwise."""
+
+_OBSERVERS_LOCK = threading.Lock()
+
+
+def add_observer(observer: ObserverFunc) -> None:
+    """
+    Installs an observer notified of every timed step of loading configurations, in every thread.
+
+    Observers are called synchronously from the thread performing the step, so they should be fast. Steps run by
+    worker processes, e.g. reads on a `ProcessPoolExecutor`, are not reported.
+
+    Args:
+        observer (ObserverFunc): The function receiving the events.
+    """
+    with _OBSERVERS_LOCK:
+        OBSERVERS.append(observer)
+
+
+def remove_observer(observer: ObserverFunc) -> None:
+    """
+    Removes an observer installed with `add_observer`.
+
+    Args:
+        observer (ObserverFunc): The function to remove.
+
+    Raises:
+        ValueError: If the observer is not installed.
+    """
+    with _OBSERVERS_LOCK:
+        OBSERVERS.remove(observer)
+
+
+def notify(event: ProfileEvent) -> None:
+    """Reports an event to every installed observer."""
+    for observer in tuple(OBSERVERS):
+        observer(event)
+
+
+class ProfileCollector:
+    """
+    Observer collecting the events of the configurations loaded while it is installed.
+
+    It can be used as a context manager, which installs and removes it:
+
+        with ProfileCollector() as collector:
+            load_config("path/to/main_config.yaml")
+
+        print(collector.table())
+    """
+
+    def __init__(self) -> None:
+        self.events: List[ProfileEvent] = []
+        """The collected events, in the order they were reported."""
+        self._lock = threading.Lock()
+
+    def __call__(self, event: ProfileEvent) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def __enter__(self) -> "ProfileCollector":
+        add_observer(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        remove_observer(self)
+
+    def table(self) -> str:
+        """
+        Summarizes the collected events per file, slowest files first.
+
+        Returns:
+            str: A plain-text table with the number of reads, the bytes read and the time spent in `os.stat`,
+                reading and parsing, and resolving references to every file, followed by a summary of the merges.
+        """
+        rows: Dict[Path, List[float]] = dict()
+        merges = [event for event in self.events if event.kind == "merge"]
+
+        for event in self.events:
+            if event.path is None or event.kind not in ("stat", "read", "resolve"):
+                continue
+
+            row = rows.setdefault(event.path.resolve(), [0, 0, 0.0, 0.0, 0.0, 0])
+
+            if event.kind == "stat":
+                row[2] += event.elapsed
+            elif event.kind == "read":
+                row[0] += 1
+                row[1] += event.nbytes or 0
+                row[3] += event.elapsed
+            else:
+                row[4] += event.elapsed
+                row[5] += 1
+
+        lines = [f"{'file':<48} {'reads':>6} {'bytes':>10} {'stat ms':>9} {'read ms':>9} {'resolve ms':>10} {'refs':>5}"]
+
+        for path, (reads, nbytes, stat_time, read_time, resolve_time, resolves) in sorted(
+            rows.items(), key=lambda item: -(item[1][3] + item[1][4])
+        ):
+            lines.append(
+                f"{_shorten(str(path), 48):<48} {reads:>6.0f} {nbytes:>10.0f} {stat_time * 1000:>9.3f} "
+                f"{read_time * 1000:>9.3f} {resolve_time * 1000:>10.3f} {resolves:>5.0f}"
+            )
+
+        if merges:
+            lines.append(
+                f"{len(merges)} merges of {sum(event.keys or 0 for event in merges)} keys in "
+                f"{sum(event.elapsed for event in merges) * 1000:.3f} ms, "
+                f"deepest at level {max(event.depth or 0 for event in merges)}"
+            )
+
+        return "\n".join(lines)
+
+    def folded(self) -> str:
+        """
+        Formats the collected events as folded stacks, the input format of flamegraph tools.
+
+        Every configuration is a root frame with a child frame for every file of its include chain, so the width
+        of a file covers the time spent reading it and the files it references. Times are in microseconds.
+
+        Returns:
+            str: One `frame;frame;frame microseconds` line per stack.
+        """
+        # Folded stacks hold the self time of each frame, so the time of `load_config` itself is what remains
+        # once the time of the references and merges below it is taken out.
+        stacks: Dict[str, float] = {"load_config": 0.0}
+
+        for event in self.events:
+            if event.kind == "load":
+                stacks["load_config"] += event.elapsed
+                continue
+            elif event.kind == "resolve":
+                stack = ";".join(["load_config", *(_frame(path) for path in event.chain)])
+            elif event.kind == "merge":
+                stack = "load_config;merge"
+            else:
+                continue
+
+            stacks["load_config"] -= event.elapsed
+            stacks[stack] = stacks.get(stack, 0.0) + event.elapsed
+
+        return "\n".join(f"{stack} {max(round(elapsed * 1e6), 0)}" for stack, elapsed in stacks.items())
+
+
+def _frame(path: Path) -> str:
+    return str(path).replace(";", ":")
+
+
+def _shorten(text: str, width: int) -> str:
+    return text if len(text) <= width else "..." + text[-(width - 3) :]
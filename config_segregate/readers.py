@@ -1,22 +1,29 @@
-import json
+import mmap
+import os
+import stat
+from functools import lru_cache, partial
+from importlib.util import find_spec
 from os import PathLike
 from pathlib import Path
-from typing import Any, Callable, Dict, Hashable, Union
-
-import yaml
-
-try:
-    import toml
-except ImportError:
-    WITH_TOML = False
-else:
-    WITH_TOML = True
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar, Union
 
+from .cache import MISSING, CacheInfo, FileCache, copy_tree
+from .profiling import OBSERVERS, ProfileEvent, notify
 
 __all__ = [
     "ReaderFunc",
+    "BufferReaderFunc",
+    "AsyncReaderFunc",
     "register_reader",
+    "register_buffer_reader",
+    "register_async_reader",
     "read_file",
+    "read_file_async",
+    "enable_cache",
+    "disable_cache",
+    "cache_info",
+    "cache_clear",
 ]
 
 
@@ -24,9 +31,33 @@ ReaderFunc = Callable[[Path], Dict[Hashable, Any]]
 """A type alias for reader functions, which take a `Path` and return a dictionary of parsed data."""
 
 
+BufferReaderFunc = Callable[[memoryview], Dict[Hashable, Any]]
+"""A type alias for buffer reader functions, which take the content of a file and return a dictionary of parsed data."""
+
+
+AsyncReaderFunc = Callable[[Path], Awaitable[Dict[Hashable, Any]]]
+"""A type alias for asynchronous reader functions, which take a `Path` and return a dictionary of parsed data."""
+
+_T = TypeVar("_T")
+
+
 READER_REGISTRY: Dict[str, ReaderFunc] = dict()
 """A registry mapping file extensions to their corresponding reader functions."""
 
+ASYNC_READER_REGISTRY: Dict[str, AsyncReaderFunc] = dict()
+"""A registry mapping file extensions to their corresponding asynchronous reader functions."""
+
+JSON_BACKEND = "orjson" if find_spec("orjson") else "msgspec" if find_spec("msgspec") else "json"
+"""Library parsing and writing JSON files: `orjson` or `msgspec` when installed, otherwise `json` from the standard
+library. Like every format backend, it is only imported when the first file of its format is read or written. Data
+the fast backends can't write as is, like non-finite floats or integers beyond 64 bits, is written with `json`."""
+
+MMAP_THRESHOLD = 256 * 1024
+"""Size in bytes from which files are memory-mapped for buffer readers, smaller files are read in a single call."""
+
+FILE_CACHE: Optional[FileCache] = None
+"""Process-wide cache of parsed files, disabled until `enable_cache` is called."""
+
 
 def register_reader(key: str, reader_func: ReaderFunc) -> None:
     """
@@ -37,6 +68,79 @@ def register_reader(key: str, reader_func: ReaderFunc) -> None:
         reader_func (ReaderFunc): The function that will handle reading and parsing files with the specified extension.
     """
     READER_REGISTRY[key] = reader_func
+    cache_clear()
+
+
+def register_buffer_reader(key: str, reader_func: BufferReaderFunc) -> None:
+    """
+    Registers a new reader function taking the content of files instead of their path.
+
+    Files of at least `MMAP_THRESHOLD` bytes are memory-mapped, so the reader parses them straight from the page
+    cache without copying or decoding them first. The buffer is only valid during the call, so the reader must not
+    keep references to it, e.g. slices of the `memoryview`, in the returned data.
+
+    Args:
+        key (str): The file extension (including the leading dot) to associate with the reader function.
+        reader_func (BufferReaderFunc): The function that will handle parsing the content of files with the
+            specified extension.
+    """
+    register_reader(key, partial(_read_buffer, reader_func))
+
+
+def register_async_reader(key: str, reader_func: AsyncReaderFunc) -> None:
+    """
+    Registers a new asynchronous reader function for a specific file extension, used by `read_file_async`.
+
+    Extensions without an asynchronous reader fall back to the reader registered with `register_reader`,
+    which then runs in a worker thread.
+
+    Args:
+        key (str): The file extension (including the leading dot) to associate with the reader function.
+        reader_func (AsyncReaderFunc): The coroutine function that will handle reading and parsing files with
+            the specified extension.
+    """
+    ASYNC_READER_REGISTRY[key] = reader_func
+    cache_clear()
+
+
+def enable_cache(maxsize: Optional[int] = 128, maxbytes: Optional[int] = None) -> None:
+    """
+    Enables the process-wide cache of parsed files used by `read_file`.
+
+    Cached files are validated with a single `os.stat` call on every read, and are re-read only when their
+    modification time, size or inode changed. Calling it again replaces the cache, dropping every entry.
+
+    Args:
+        maxsize (Optional[int]): Maximum number of cached files, `None` for no limit.
+        maxbytes (Optional[int]): Maximum total on-disk size of the cached files, `None` for no limit.
+    """
+    global FILE_CACHE
+    FILE_CACHE = FileCache(maxsize, maxbytes)
+
+
+def disable_cache() -> None:
+    """Disables and drops the process-wide cache of parsed files."""
+    global FILE_CACHE
+    FILE_CACHE = None
+
+
+def cache_info() -> CacheInfo:
+    """
+    Reports the statistics of the process-wide cache of parsed files.
+
+    Returns:
+        CacheInfo: Hits, misses, the entry budget and the number of cached files, all zeros if the cache is disabled.
+    """
+    if FILE_CACHE is None:
+        return CacheInfo(0, 0, 0, 0)
+
+    return FILE_CACHE.cache_info()
+
+
+def cache_clear() -> None:
+    """Drops every entry of the process-wide cache of parsed files and resets its statistics."""
+    if FILE_CACHE is not None:
+        FILE_CACHE.cache_clear()
 
 
 def read_file(path_to_file: Union[str, PathLike[str], Path]) -> Dict[Hashable, Any]:
@@ -47,24 +151,40 @@ def read_file(path_to_file: Union[str, PathLike[str], Path]) -> Dict[Hashable, A
         path_to_file (Union[str, PathLike[str], Path]): The path to the file to be read.
 
     Returns:
-        Dict[Hashable, Any]: The parsed content of the file.
+        Dict[Hashable, Any]: The parsed content of the file. When the cache is enabled, it is a copy of the
+            cached data, so it can be freely mutated.
 
     Raises:
         FileNotFoundError: If the specified file does not exist.
         OSError: If the specified path is not a file.
         ValueError: If no reader function is registered for the file's extension.
     """
-    if not isinstance(path_to_file, Path):
-        path_to_file = Path(path_to_file)
+    data: Dict[Hashable, Any] = _read_file(path_to_file, copy_cached=True)
 
-    if not path_to_file.exists():
-        raise FileNotFoundError(f"File `{path_to_file}` was not found.")
+    return data
 
-    if not path_to_file.is_file():
-        raise OSError(f"`{path_to_file}` should be a file.")
 
+def _read_file(path_to_file: Union[str, PathLike[str], Path], copy_cached: bool) -> Any:
+    """
+    Implements `read_file`, optionally handing out the cached data itself instead of a copy.
+
+    Callers passing `copy_cached=False` must treat the returned data as read-only.
+    """
+    return _read_file_with_stat(path_to_file, copy_cached)[0]
+
+
+def _read_file_with_stat(path_to_file: Union[str, PathLike[str], Path], copy_cached: bool) -> Tuple[Any, os.stat_result]:
+    """Implements `_read_file`, also returning the `os.stat` of the file taken before reading it."""
+    if not isinstance(path_to_file, Path):
+        path_to_file = Path(path_to_file)
+
+    start = perf_counter() if OBSERVERS else 0.0
+    file_stat = _stat_file(path_to_file)
     file_extension = path_to_file.suffix
 
+    if OBSERVERS:
+        notify(ProfileEvent("stat", path_to_file, perf_counter() - start, nbytes=file_stat.st_size))
+
     if file_extension not in READER_REGISTRY:
         raise ValueError(
             f"Does not support `{file_extension}` extension. "
@@ -72,26 +192,185 @@ def read_file(path_to_file: Union[str, PathLike[str], Path]) -> Dict[Hashable, A
             "registering using `register_reader` function."
         )
 
-    return READER_REGISTRY[file_extension](path_to_file)
+    reader_func = READER_REGISTRY[file_extension]
+
+    if OBSERVERS:
+        reader_func = partial(_observe_reader, reader_func, file_stat.st_size)
+
+    file_cache = FILE_CACHE
+
+    if file_cache is None:
+        return reader_func(path_to_file), file_stat
+
+    key = path_to_file.resolve()
+    signature = _signature(file_stat)
+    data = file_cache.get(key, signature)
+
+    if data is MISSING:
+        data = reader_func(path_to_file)
+        file_cache.put(key, signature, data, file_stat.st_size)
+
+    return copy_tree(data) if copy_cached else data, file_stat
+
+
+async def read_file_async(path_to_file: Union[str, PathLike[str], Path]) -> Dict[Hashable, Any]:
+    """
+    Reads and parses a file without blocking the running event loop.
+
+    Uses the reader registered with `register_async_reader` for the file's extension, or runs the reader
+    registered with `register_reader` in a worker thread if there is none.
+
+    Args:
+        path_to_file (Union[str, PathLike[str], Path]): The path to the file to be read.
+
+    Returns:
+        Dict[Hashable, Any]: The parsed content of the file.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+        OSError: If the specified path is not a file.
+        ValueError: If no reader function is registered for the file's extension.
+    """
+    data: Dict[Hashable, Any] = await _read_file_async(path_to_file, copy_cached=True)
+
+    return data
+
+
+async def _read_file_async(path_to_file: Union[str, PathLike[str], Path], copy_cached: bool) -> Any:
+    """Implements `read_file_async`, see `_read_file` for `copy_cached`."""
+    if not isinstance(path_to_file, Path):
+        path_to_file = Path(path_to_file)
+
+    reader_func = ASYNC_READER_REGISTRY.get(path_to_file.suffix)
+
+    if reader_func is None:
+        return await _to_thread(_read_file, path_to_file, copy_cached)
+
+    file_cache = FILE_CACHE
+
+    if file_cache is None:
+        await _to_thread(_stat_file, path_to_file)
+        return await reader_func(path_to_file)
+
+    file_stat, key = await _to_thread(_stat_and_resolve, path_to_file)
+    signature = _signature(file_stat)
+    data = file_cache.get(key, signature)
+
+    if data is MISSING:
+        data = await reader_func(path_to_file)
+        file_cache.put(key, signature, data, file_stat.st_size)
+
+    return copy_tree(data) if copy_cached else data
+
+
+def _observe_reader(reader_func: ReaderFunc, nbytes: int, path_to_file: Path) -> Dict[Hashable, Any]:
+    start = perf_counter()
+    data = reader_func(path_to_file)
+    notify(ProfileEvent("read", path_to_file, perf_counter() - start, nbytes=nbytes))
+
+    return data
+
+
+def _stat_file(path_to_file: Path) -> os.stat_result:
+    try:
+        file_stat = path_to_file.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File `{path_to_file}` was not found.") from None
+
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise OSError(f"`{path_to_file}` should be a file.")
+
+    return file_stat
+
+
+def _stat_and_resolve(path_to_file: Path) -> Tuple[os.stat_result, Path]:
+    return _stat_file(path_to_file), path_to_file.resolve()
+
+
+def _signature(file_stat: os.stat_result) -> Hashable:
+    return (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+
+
+async def _to_thread(func: Callable[..., _T], *args: Any) -> _T:
+    import asyncio
+
+    if hasattr(asyncio, "to_thread"):
+        return await asyncio.to_thread(func, *args)
+
+    # Python 3.8 has no `asyncio.to_thread`, fall back to the default executor.
+    return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args))
+
+
+def _read_buffer(reader_func: BufferReaderFunc, path_to_file: Path) -> Dict[Hashable, Any]:
+    with open(path_to_file, "rb") as buffer_file:
+        file_size = os.fstat(buffer_file.fileno()).st_size
+
+        # Mapping costs a few system calls and page faults, which only pay off for large files.
+        # Empty files can't be mapped at all.
+        if file_size < MMAP_THRESHOLD or file_size == 0:
+            return reader_func(memoryview(buffer_file.read()))
+
+        with mmap.mmap(buffer_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            with memoryview(mapped_file) as content:
+                return reader_func(content)
 
 
 def read_json_file(path_to_file: Path) -> Dict[Hashable, Any]:
-    with open(path_to_file) as json_file:
-        data: Dict[Hashable, Any] = json.load(json_file)
+    return _read_buffer(read_json_buffer, path_to_file)
+
+
+def read_json_buffer(content: memoryview) -> Dict[Hashable, Any]:
+    data: Dict[Hashable, Any] = _loads_json(content)
 
     return data
 
 
+def _loads_json(content: memoryview) -> Any:
+    # The fast backends reject a few inputs accepted by `json`, e.g. `NaN` literals or integers
+    # beyond 64 bits, so they fall back to `json`, which also reports genuinely invalid documents.
+    if JSON_BACKEND == "orjson":
+        import orjson
+
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+
+    elif JSON_BACKEND == "msgspec":
+        import msgspec
+
+        try:
+            return msgspec.json.decode(content)
+        except msgspec.DecodeError:
+            pass
+
+    import json
+
+    return json.loads(bytes(content))
+
+
 def read_yaml_file(path_to_file: Path) -> Dict[Hashable, Any]:
-    with open(path_to_file) as yaml_file:
-        data: Dict[Hashable, Any] = yaml.safe_load(yaml_file)
+    import yaml
+
+    # Binary streams let libyaml detect and decode the encoding itself, skipping Python's text layer.
+    with open(path_to_file, "rb") as yaml_file:
+        data: Dict[Hashable, Any] = yaml.load(yaml_file, Loader=_yaml_safe_loader())
 
     return data
 
 
+@lru_cache(maxsize=None)
+def _yaml_safe_loader() -> Any:
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def read_toml_file(path_to_file: Path) -> Dict[Hashable, Any]:
-    if not WITH_TOML:
-        raise ModuleNotFoundError("Library `toml` is required to directly work with toml files.")
+    try:
+        import toml
+    except ImportError:
+        raise ModuleNotFoundError("Library `toml` is required to directly work with toml files.") from None
 
     with open(path_to_file) as toml_file:
         data: Dict[Hashable, Any] = toml.load(toml_file)  # type: ignore
@@ -104,3 +383,13 @@ register_reader(".json", read_json_file)
 register_reader(".yml", read_yaml_file)
 register_reader(".yaml", read_yaml_file)
 register_reader(".toml", read_toml_file)
+
+
+def __getattr__(name: str) -> Any:
+    # `WITH_LIBYAML` needs `yaml` to be imported, so it is only computed when asked for.
+    if name == "WITH_LIBYAML":
+        import yaml
+
+        return yaml.__with_libyaml__
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
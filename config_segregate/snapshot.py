@@ -0,0 +1,139 @@
+import hashlib
+import os
+import pickle
+from os import PathLike
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional, Tuple, TypedDict, Union
+
+from .writers import write_file
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "Snapshot",
+    "save_snapshot",
+    "load_snapshot",
+]
+
+
+SNAPSHOT_VERSION = 1
+"""Version of the snapshot layout, snapshots written with another version are ignored."""
+
+
+class Snapshot(TypedDict):
+    version: int
+    """Version of the snapshot layout."""
+    root: str
+    """Resolved path of the configuration file the snapshot was made from."""
+    files: Dict[str, Tuple[int, int, str]]
+    """Modification time, size and SHA-256 digest of every source file, keyed on its resolved path."""
+    config: Dict[Hashable, Any]
+    """The processed configuration dictionary."""
+
+
+def save_snapshot(
+    path_to_snapshot: Union[str, PathLike[str], Path],
+    path_to_file: Union[str, PathLike[str], Path],
+    config: Dict[Hashable, Any],
+    source_files: Iterable[Union[str, PathLike[str], Path]],
+    read_stats: Optional[Mapping[Path, os.stat_result]] = None,
+) -> bool:
+    """
+    Persists a processed configuration together with a manifest of the files it was assembled from.
+
+    The snapshot is written atomically with `write_file`, so it replaces any previous snapshot as a whole. Source
+    files are fingerprinted after the configuration was loaded, so a file changing in the meantime would leave a
+    stale configuration under a fresh manifest. Files whose `os.stat` taken before reading them is given in
+    `read_stats` are checked against it, and the snapshot is not written if one of them changed since.
+
+    Args:
+        path_to_snapshot (Union[str, PathLike[str], Path]): The path to the snapshot, with a `.snapshot` extension.
+        path_to_file (Union[str, PathLike[str], Path]): The path to the configuration file that was loaded.
+        config (Dict[Hashable, Any]): The processed configuration dictionary.
+        source_files (Iterable[Union[str, PathLike[str], Path]]): Every file read while loading the configuration.
+        read_stats (Optional[Mapping[Path, os.stat_result]]): The `os.stat` of source files taken before they were
+            read, keyed on their resolved path.
+
+    Returns:
+        bool: `True` if the snapshot was written, `False` if a source file changed since it was read.
+    """
+    path_to_snapshot = Path(path_to_snapshot)
+    files: Dict[str, Tuple[int, int, str]] = dict()
+
+    for source_file in source_files:
+        resolved_path = Path(source_file).resolve()
+        fingerprint = _fingerprint(resolved_path)
+        read_stat = None if read_stats is None else read_stats.get(resolved_path)
+
+        if fingerprint is None or (
+            read_stat is not None and (read_stat.st_mtime_ns, read_stat.st_size) != fingerprint[:2]
+        ):
+            return False
+
+        files[str(resolved_path)] = fingerprint
+
+    snapshot: Snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "root": str(Path(path_to_file).resolve()),
+        "files": files,
+        "config": config,
+    }
+
+    return write_file(path_to_snapshot, snapshot, overwrite=True, atomic=True)  # type: ignore[arg-type]
+
+
+def load_snapshot(
+    path_to_snapshot: Union[str, PathLike[str], Path],
+    path_to_file: Union[str, PathLike[str], Path],
+) -> Optional[Dict[Hashable, Any]]:
+    """
+    Loads a processed configuration from a snapshot if none of its source files changed.
+
+    A source file is considered unchanged if its modification time and size match the manifest, or otherwise if its
+    content still has the same SHA-256 digest, e.g. after being copied into a container image. Snapshots are pickles,
+    so they must only be loaded from locations as trusted as the code itself.
+
+    Args:
+        path_to_snapshot (Union[str, PathLike[str], Path]): The path to the snapshot.
+        path_to_file (Union[str, PathLike[str], Path]): The path to the configuration file the snapshot should match.
+
+    Returns:
+        Optional[Dict[Hashable, Any]]: The processed configuration dictionary, or `None` if the snapshot is missing,
+            unreadable, made from another file or outdated.
+    """
+    try:
+        with open(path_to_snapshot, "rb") as snapshot_file:
+            snapshot: Snapshot = pickle.load(snapshot_file)
+
+        if snapshot["version"] != SNAPSHOT_VERSION or snapshot["root"] != str(Path(path_to_file).resolve()):
+            return None
+
+        for source_file, (mtime_ns, size, digest) in snapshot["files"].items():
+            file_stat = os.stat(source_file)
+
+            if (file_stat.st_mtime_ns, file_stat.st_size) == (mtime_ns, size):
+                continue
+
+            if file_stat.st_size != size or _digest(Path(source_file)) != digest:
+                return None
+
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+    return snapshot["config"]
+
+
+def _fingerprint(path_to_file: Path) -> Optional[Tuple[int, int, str]]:
+    # The digest only matches the stat if the file did not change while it was hashed.
+    file_stat = os.stat(path_to_file)
+    digest = _digest(path_to_file)
+    after_stat = os.stat(path_to_file)
+
+    if (file_stat.st_mtime_ns, file_stat.st_size) != (after_stat.st_mtime_ns, after_stat.st_size):
+        return None
+
+    return (file_stat.st_mtime_ns, file_stat.st_size, digest)
+
+
+def _digest(path_to_file: Path) -> str:
+    with open(path_to_file, "rb") as source_file:
+        return hashlib.sha256(source_file.read()).hexdigest()
@@ -0,0 +1,320 @@
+import ctypes
+import os
+import select
+import struct
+import sys
+import threading
+from os import PathLike
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+from .graph import ConfigGraph, _signature
+
+__all__ = [
+    "ConfigCallback",
+    "ConfigWatcher",
+    "watch_config",
+]
+
+
+ConfigCallback = Callable[[Dict[Hashable, Any]], None]
+"""A type alias for subscribers of a `ConfigWatcher`, which receive the reloaded configuration dictionary."""
+
+
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_WATCH_MASK = (
+    0x00000002  # IN_MODIFY
+    | 0x00000004  # IN_ATTRIB
+    | 0x00000008  # IN_CLOSE_WRITE
+    | 0x00000040  # IN_MOVED_FROM
+    | 0x00000080  # IN_MOVED_TO
+    | 0x00000100  # IN_CREATE
+    | 0x00000200  # IN_DELETE
+)
+_IN_EVENT_HEADER = struct.Struct("iIII")
+
+
+class ConfigWatcher:
+    """
+    Watches the files of a configuration and pushes the reloaded configuration to its subscribers.
+
+    The files to watch are the ones of the include graph of the configuration, see `ConfigGraph`. On Linux, changes
+    are reported by inotify, watching the directories of these files so that editors replacing a file are noticed as
+    well; elsewhere the files are polled with `os.stat`. A burst of changes is debounced into a single reload, which
+    re-reads only the changed files. Subscribers are notified from the watcher thread, and only when the processed
+    configuration actually changed.
+
+    A reload that fails (e.g. on a half-written file) keeps the previous configuration and is retried on the next
+    change; the exception is passed to `on_error` if given.
+    """
+
+    def __init__(
+        self,
+        path_to_file: Union[str, PathLike[str], Path],
+        interval: float = 1.0,
+        debounce: float = 0.1,
+        relative_to_file: bool = False,
+        use_inotify: Optional[bool] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """
+        Loads the configuration, without starting to watch it.
+
+        Args:
+            path_to_file (Union[str, PathLike[str], Path]): The path to the configuration file.
+            interval (float): Seconds between two polls of the files, when inotify is not used.
+            debounce (float): Seconds without further changes to wait for before reloading.
+            relative_to_file (bool): Resolve relative reference paths against the directory of the file containing
+                the reference, see `ResolutionContext`.
+            use_inotify (Optional[bool]): Whether to use inotify, which is only available on Linux. Defaults to
+                using it when available.
+            on_error (Optional[Callable[[Exception], None]]): Called with the exception of every failed reload.
+
+        Raises:
+            OSError: If `use_inotify` is `True` but inotify is not available.
+        """
+        if use_inotify and _load_libc() is None:
+            raise OSError("inotify is not available on this platform.")
+
+        self.interval = interval
+        self.debounce = debounce
+        self.use_inotify = _load_libc() is not None if use_inotify is None else use_inotify
+        self.on_error = on_error
+        self._graph = ConfigGraph(path_to_file, relative_to_file)
+        self._subscribers: List[ConfigCallback] = []
+        self._lock = threading.Lock()
+        # Serializes the refreshes of the graph with the checks reading it, as `check` may run in any thread.
+        self._graph_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._wakeup_read, self._wakeup_write = -1, -1
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def config(self) -> Dict[Hashable, Any]:
+        """The latest processed configuration dictionary, which must be treated as read-only."""
+        return self._graph.config
+
+    def subscribe(self, callback: ConfigCallback) -> None:
+        """
+        Registers a subscriber notified with every reloaded configuration.
+
+        Args:
+            callback (ConfigCallback): The function receiving the reloaded configuration dictionary.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: ConfigCallback) -> None:
+        """
+        Removes a subscriber registered with `subscribe`.
+
+        Args:
+            callback (ConfigCallback): The function to remove.
+        """
+        with self._lock:
+            self._subscribers.remove(callback)
+
+    def check(self) -> bool:
+        """
+        Reloads the configuration if any of its files changed, notifying the subscribers if it did.
+
+        Called by the watcher thread, it can also be called directly to check for changes synchronously.
+
+        Returns:
+            bool: Whether the processed configuration changed.
+        """
+        try:
+            with self._graph_lock:
+                if not self._graph.dirty_files():
+                    return False
+
+                config, changed = self._graph.refresh()
+        except Exception as exception:
+            if self.on_error is not None:
+                self.on_error(exception)
+            return False
+
+        if not changed:
+            return False
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for callback in subscribers:
+            callback(config)
+
+        return True
+
+    def start(self) -> "ConfigWatcher":
+        """
+        Starts watching the files in a daemon thread.
+
+        Returns:
+            ConfigWatcher: The watcher itself.
+        """
+        if self._thread is not None:
+            raise RuntimeError("The watcher is already started.")
+
+        self._stopped.clear()
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        target = self._watch_inotify if self.use_inotify else self._watch_polling
+        self._thread = threading.Thread(target=target, name=f"watch-config-{self._graph.root.name}", daemon=True)
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """Stops watching the files and waits for the watcher thread to exit."""
+        if self._thread is None:
+            return
+
+        self._stopped.set()
+        os.write(self._wakeup_write, b"\0")
+        self._thread.join()
+        self._thread = None
+        os.close(self._wakeup_read)
+        os.close(self._wakeup_write)
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self if self._thread is not None else self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _watch_polling(self) -> None:
+        while not self._stopped.wait(self.interval):
+            changes = self._dirty_signatures()
+
+            # Wait for a quiet period, during which the changed files stay the same, before reloading.
+            while changes and not self._stopped.wait(self.debounce):
+                previous_changes, changes = changes, self._dirty_signatures()
+
+                if changes == previous_changes:
+                    self.check()
+                    break
+
+    def _dirty_signatures(self) -> Dict[Path, Optional[Hashable]]:
+        signatures: Dict[Path, Optional[Hashable]] = dict()
+
+        with self._graph_lock:
+            dirty_files = self._graph.dirty_files()
+
+        for path in dirty_files:
+            try:
+                signatures[path] = _signature(path)
+            except OSError:
+                signatures[path] = None
+
+        return signatures
+
+    def _watch_inotify(self) -> None:
+        libc = _load_libc()
+        assert libc is not None
+        inotify_fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+
+        if inotify_fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed.")
+
+        try:
+            directories: Dict[int, Path] = dict()
+            watched = self._add_watches(libc, inotify_fd, directories)
+
+            while not self._stopped.is_set():
+                # Wait for a change to one of the files, then for a quiet period before reloading.
+                if not self._wait_events(inotify_fd, directories, watched, None):
+                    continue
+
+                while self._wait_events(inotify_fd, directories, watched, self.debounce):
+                    pass
+
+                if not self._stopped.is_set():
+                    self.check()
+                    watched = self._add_watches(libc, inotify_fd, directories)
+        finally:
+            os.close(inotify_fd)
+
+    def _add_watches(self, libc: Any, inotify_fd: int, directories: Dict[int, Path]) -> Set[Tuple[Path, str]]:
+        with self._graph_lock:
+            watched = {(path.parent, path.name) for path in self._graph.files}
+
+        for directory in {parent for parent, _ in watched} - set(directories.values()):
+            descriptor = libc.inotify_add_watch(inotify_fd, os.fsencode(directory), _IN_WATCH_MASK)
+
+            if descriptor >= 0:
+                directories[descriptor] = directory
+
+        return watched
+
+    def _wait_events(
+        self, inotify_fd: int, directories: Dict[int, Path], watched: Set[Tuple[Path, str]], timeout: Optional[float]
+    ) -> bool:
+        readable, _, _ = select.select([inotify_fd, self._wakeup_read], [], [], timeout)
+
+        if self._stopped.is_set() or inotify_fd not in readable:
+            return False
+
+        relevant = False
+        buffer = os.read(inotify_fd, 64 * 1024)
+        offset = 0
+
+        while offset < len(buffer):
+            descriptor, _, _, length = _IN_EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _IN_EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            directory = directories.get(descriptor)
+            relevant = relevant or (directory is not None and (directory, name) in watched)
+
+        return relevant
+
+
+def watch_config(
+    path_to_file: Union[str, PathLike[str], Path],
+    callback: ConfigCallback,
+    interval: float = 1.0,
+    debounce: float = 0.1,
+    relative_to_file: bool = False,
+    use_inotify: Optional[bool] = None,
+    on_error: Optional[Callable[[Exception], None]] = None,
+) -> ConfigWatcher:
+    """
+    Loads a configuration and starts pushing it to `callback` whenever one of its files changes.
+
+    Args:
+        path_to_file (Union[str, PathLike[str], Path]): The path to the configuration file.
+        callback (ConfigCallback): The function receiving every reloaded configuration dictionary.
+        interval (float): Seconds between two polls of the files, when inotify is not used.
+        debounce (float): Seconds without further changes to wait for before reloading.
+        relative_to_file (bool): Resolve relative reference paths against the directory of the file containing
+            the reference, see `ResolutionContext`.
+        use_inotify (Optional[bool]): Whether to use inotify, defaults to using it when available.
+        on_error (Optional[Callable[[Exception], None]]): Called with the exception of every failed reload.
+
+    Returns:
+        ConfigWatcher: The started watcher, see `ConfigWatcher.config` for the current configuration and
+            `ConfigWatcher.stop` to stop watching.
+    """
+    watcher = ConfigWatcher(path_to_file, interval, debounce, relative_to_file, use_inotify, on_error)
+    watcher.subscribe(callback)
+
+    return watcher.start()
+
+
+_LIBC: Optional[Any] = None
+
+
+def _load_libc() -> Optional[Any]:
+    global _LIBC
+
+    if _LIBC is None and sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            libc.inotify_init1
+            libc.inotify_add_watch
+        except (OSError, AttributeError):
+            pass
+        else:
+            _LIBC = libc
+
+    return _LIBC
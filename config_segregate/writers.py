@@ -1,21 +1,20 @@
-import json
+import math
+import os
+import pickle
+import stat
+import threading
+from functools import lru_cache, partial
 from os import PathLike
 from pathlib import Path
-from typing import Any, Callable, Dict, Hashable, Union
-
-import yaml
-
-try:
-    import toml
-except ImportError:
-    WITH_TOML = False
-else:
-    WITH_TOML = True
+from typing import Any, Callable, Dict, Hashable, Optional, Union
 
+from . import readers
 
 __all__ = [
     "WriterFunc",
+    "BufferWriterFunc",
     "register_writer",
+    "register_buffer_writer",
     "write_file",
 ]
 
@@ -23,6 +22,9 @@ __all__ = [
 WriterFunc = Callable[[Path, Dict[Hashable, Any]], None]
 """A type alias for writer functions, which take a `Path` and a dictionary of data to write to the file."""
 
+BufferWriterFunc = Callable[[Dict[Hashable, Any]], bytes]
+"""A type alias for buffer writer functions, which take a dictionary of data and return the content of the file."""
+
 WRITER_REGISTRY: Dict[str, WriterFunc] = dict()
 """A registry mapping file extensions to their corresponding writer functions."""
 
@@ -38,26 +40,80 @@ def register_writer(key: str, writer_func: WriterFunc) -> None:
     WRITER_REGISTRY[key] = writer_func
 
 
-def write_file(path_to_file: Union[str, PathLike[str], Path], data: Dict[Hashable, Any]) -> None:
+def register_buffer_writer(key: str, writer_func: BufferWriterFunc) -> None:
+    """
+    Registers a new writer function returning the content of files instead of writing them.
+
+    The content is written with a single call, and lets `write_file` skip files whose content would not change
+    without writing anything to disk.
+
+    Args:
+        key (str): The file extension (including the leading dot) to associate with the writer function.
+        writer_func (BufferWriterFunc): The function that will handle serializing data to files with the specified
+            extension.
+    """
+    register_writer(key, partial(_write_buffer, writer_func))
+
+
+def write_file(
+    path_to_file: Union[str, PathLike[str], Path],
+    data: Dict[Hashable, Any],
+    overwrite: bool = False,
+    atomic: bool = False,
+    skip_unchanged: bool = False,
+) -> bool:
     """
     Writes data to a file based on its extension using the appropriate writer function.
 
     Args:
         path_to_file (Union[str, PathLike[str], Path]): The path to the file where data will be written.
         data (Dict[str, Any]): The data to write to the file.
+        overwrite (bool): Replace the file if it already exists.
+        atomic (bool): Write to a temporary file in the same folder, flush it to disk and move it over the file,
+            so readers see either the previous or the new content, never a partially written file. The permissions
+            of a replaced file are kept.
+        skip_unchanged (bool): Leave an existing file untouched, along with its modification time, if its content
+            is already the one that would be written. Files rendered by writers registered with `register_writer`
+            are written to a temporary file to be compared.
+
+    Returns:
+        bool: `True` if the file was written, `False` if it was skipped as unchanged.
 
     Raises:
         OSError: If the parent directory does not exist.
-        FileExistsError: If the file already exists.
+        FileExistsError: If the file already exists and `overwrite` is not set.
         ValueError: If no writer function is registered for the file's extension.
     """
     if not isinstance(path_to_file, Path):
         path_to_file = Path(path_to_file)
 
+    return _write_file(path_to_file, data, None, overwrite, atomic, skip_unchanged)
+
+
+def _serialize(path_to_file: Path, data: Dict[Hashable, Any]) -> Optional[bytes]:
+    # Returns the content `write_file` would write, `None` if the writer of the extension works on paths.
+    writer_func = WRITER_REGISTRY.get(path_to_file.suffix)
+
+    if isinstance(writer_func, partial) and writer_func.func is _write_buffer:
+        content: bytes = writer_func.args[0](data)
+        return content
+
+    return None
+
+
+def _write_file(
+    path_to_file: Path,
+    data: Dict[Hashable, Any],
+    content: Optional[bytes],
+    overwrite: bool,
+    atomic: bool,
+    skip_unchanged: bool,
+) -> bool:
+    # `content` is `data` already serialized with `_serialize`, if it was needed before writing it.
     if not path_to_file.parent.exists():
         raise OSError("Missing folder.")
 
-    if path_to_file.exists():
+    if not overwrite and path_to_file.exists():
         raise FileExistsError(f"File `{path_to_file}` already exist.")
 
     file_extension = path_to_file.suffix
@@ -69,29 +125,190 @@ def write_file(path_to_file: Union[str, PathLike[str], Path], data: Dict[Hashabl
             "registering using `register_writer` function."
         )
 
-    return WRITER_REGISTRY[file_extension](path_to_file, data)
+    writer_func = WRITER_REGISTRY[file_extension]
+
+    if content is None:
+        content = _serialize(path_to_file, data)
+
+    if content is not None:
+        if skip_unchanged and _has_content(path_to_file, content):
+            return False
+
+        if atomic:
+            _replace_file(path_to_file, partial(_write_content, content=content, sync=True))
+        else:
+            _write_content(path_to_file, content, sync=False)
+
+        return True
+
+    if not atomic and not skip_unchanged:
+        writer_func(path_to_file, data)
+        return True
+
+    # Writers working on paths render the file aside, where it can be compared and synced before replacing it.
+    def write_temporary_file(temporary_path: Path) -> bool:
+        writer_func(temporary_path, data)
+
+        if skip_unchanged and _has_content(path_to_file, temporary_path.read_bytes()):
+            return False
+
+        if atomic:
+            with open(temporary_path, "rb") as temporary_file:
+                os.fsync(temporary_file.fileno())
+
+        return True
+
+    return _replace_file(path_to_file, write_temporary_file)
+
+
+def _write_buffer(writer_func: BufferWriterFunc, path_to_file: Path, data: Dict[Hashable, Any]) -> None:
+    _write_content(path_to_file, writer_func(data), sync=False)
+
+
+def _write_content(path_to_file: Path, content: bytes, sync: bool) -> bool:
+    with open(path_to_file, "wb") as target_file:
+        target_file.write(content)
+
+        if sync:
+            target_file.flush()
+            os.fsync(target_file.fileno())
+
+    return True
+
+
+def _has_content(path_to_file: Path, content: bytes) -> bool:
+    try:
+        if os.stat(path_to_file).st_size != len(content):
+            return False
+
+        with open(path_to_file, "rb") as existing_file:
+            return existing_file.read() == content
+    except FileNotFoundError:
+        return False
+
+
+def _replace_file(path_to_file: Path, write_func: Callable[[Path], bool]) -> bool:
+    # The process and thread make the name unique among concurrent writers, the suffix is kept for the writers.
+    temporary_path = path_to_file.with_name(
+        f".{path_to_file.stem}.{os.getpid()}.{threading.get_ident()}{path_to_file.suffix}"
+    )
+
+    try:
+        if not write_func(temporary_path):
+            return False
+
+        try:
+            os.chmod(temporary_path, stat.S_IMODE(os.stat(path_to_file).st_mode))
+        except FileNotFoundError:
+            pass
+
+        os.replace(temporary_path, path_to_file)
+        return True
+    finally:
+        if temporary_path.exists():
+            temporary_path.unlink()
 
 
 def write_json_file(path_to_file: Path, data: Dict[Hashable, Any]) -> None:
-    with open(path_to_file, "w") as json_file:
-        json.dump(data, json_file)
+    _write_buffer(write_json_buffer, path_to_file, data)
+
+
+def write_json_buffer(data: Dict[Hashable, Any]) -> bytes:
+    return _dumps_json(data)
+
+
+def _dumps_json(data: Any) -> bytes:
+    content: Optional[bytes] = None
+
+    # Data the fast backends reject, like integers beyond 64 bits, is serialized by the standard library instead.
+    try:
+        if readers.JSON_BACKEND == "orjson":
+            import orjson
+
+            content = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        elif readers.JSON_BACKEND == "msgspec":
+            import msgspec
+
+            content = msgspec.json.encode(data)
+    except Exception:
+        content = None
+
+    # The fast backends write non-finite floats as `null`, the standard library keeps them as `NaN` and `Infinity`.
+    if content is not None and (b"null" not in content or not _has_non_finite_floats(data)):
+        return content
+
+    import json
+
+    return json.dumps(data).encode()
+
+
+def _has_non_finite_floats(data: Any) -> bool:
+    stack = [data]
+
+    while stack:
+        value = stack.pop()
+
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+    return False
 
 
 def write_yaml_file(path_to_file: Path, data: Dict[Hashable, Any]) -> None:
-    with open(path_to_file, "w") as yaml_file:
-        yaml.dump(data, yaml_file)
+    _write_buffer(write_yaml_buffer, path_to_file, data)
+
+
+def write_yaml_buffer(data: Dict[Hashable, Any]) -> bytes:
+    import yaml
+
+    content: bytes = yaml.dump(data, Dumper=_yaml_safe_dumper(), encoding="utf-8")
+    return content
+
+
+@lru_cache(maxsize=None)
+def _yaml_safe_dumper() -> Any:
+    import yaml
+
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 def write_toml_file(path_to_file: Path, data: Dict[Hashable, Any]) -> None:
-    if not WITH_TOML:
-        raise ModuleNotFoundError("Library `toml` is required to directly work with toml files.")
+    _write_buffer(write_toml_buffer, path_to_file, data)
 
-    with open(path_to_file, "w") as toml_file:
-        toml.dump(data, toml_file)  # type: ignore
+
+def write_toml_buffer(data: Dict[Hashable, Any]) -> bytes:
+    try:
+        import toml
+    except ImportError:
+        raise ModuleNotFoundError("Library `toml` is required to directly work with toml files.") from None
+
+    return toml.dumps(data).encode()  # type: ignore[type-var]
+
+
+def write_snapshot_file(path_to_file: Path, data: Dict[Hashable, Any]) -> None:
+    _write_buffer(write_snapshot_buffer, path_to_file, data)
+
+
+def write_snapshot_buffer(data: Dict[Hashable, Any]) -> bytes:
+    return pickle.dumps(data, protocol=5)
 
 
 # Registering default writers for common file extensions
-register_writer(".json", write_json_file)
-register_writer(".yml", write_yaml_file)
-register_writer(".yaml", write_yaml_file)
-register_writer(".toml", write_toml_file)
+register_buffer_writer(".json", write_json_buffer)
+register_buffer_writer(".yml", write_yaml_buffer)
+register_buffer_writer(".yaml", write_yaml_buffer)
+register_buffer_writer(".toml", write_toml_buffer)
+register_buffer_writer(".snapshot", write_snapshot_buffer)
+
+
+def __getattr__(name: str) -> Any:
+    # The format backends are detected once, by the readers, and shared with the writers.
+    if name in ("JSON_BACKEND", "WITH_LIBYAML"):
+        return getattr(readers, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
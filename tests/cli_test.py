@@ -0,0 +1,101 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from config_segregate import load_config, write_file
+from config_segregate.cli import main
+
+
+@pytest.fixture()
+def config_tree(tmp_path: Path) -> Iterator[Path]:
+    write_file(tmp_path / "base.json", {"name": "Base", "database": {"host": "localhost", "port": 5432}})
+    write_file(
+        tmp_path / "app.yaml",
+        {"__base__": f"${{{{ {tmp_path}/base.json }}}}", "name": "App", "database": {"port": 6543}},
+    )
+    yield tmp_path
+
+
+def test_render_writes_processed_configs(config_tree: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["render", str(config_tree / "app.yaml"), "--format", "json"]) == 0
+    assert json.loads(capsys.readouterr().out) == load_config(config_tree / "app.yaml")
+
+    inputs = [str(config_tree / "app.yaml"), str(config_tree / "base.json")]
+
+    assert main(["render", *inputs, "--output-dir", str(config_tree / "out"), "--format", "toml", "--jobs", "2"]) == 0
+    assert load_config(config_tree / "out" / "app.toml") == load_config(config_tree / "app.yaml")
+    assert load_config(config_tree / "out" / "base.toml") == load_config(config_tree / "base.json")
+
+    assert main(["render", *inputs]) == 1
+    assert "--output-dir" in capsys.readouterr().err
+
+    assert main(["render", *inputs, "--output", str(config_tree / "out.json")]) == 1
+    assert "--output-dir" in capsys.readouterr().err
+    assert not (config_tree / "out.json").exists()
+
+
+@pytest.mark.parametrize("extension, content", [(".yaml", "key: [unclosed"), (".toml", "key = [unclosed")])
+def test_render_reports_invalid_files(
+    extension: str, content: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (tmp_path / f"config{extension}").write_text(content)
+
+    assert main(["render", str(tmp_path / f"config{extension}")]) == 1
+    assert capsys.readouterr().err.startswith("config-segregate: error: ")
+
+
+def test_explain_shows_the_file_of_each_value(config_tree: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["explain", str(config_tree / "app.yaml"), "database", "name"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        f'name = "App"  ({config_tree.resolve() / "app.yaml"})',
+        f'database.host = "localhost"  ({config_tree.resolve() / "base.json"})',
+        f'database.port = 6543  ({config_tree.resolve() / "app.yaml"})',
+    ]
+
+
+def test_explain_accepts_empty_base(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    (tmp_path / "config.json").write_text('{"__base__": null, "a": 1}')
+
+    assert main(["explain", str(tmp_path / "config.json")]) == 0
+    assert capsys.readouterr().out.splitlines() == [f"a = 1  ({tmp_path.resolve() / 'config.json'})"]
+
+
+def test_bench_reports_stages(config_tree: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["bench", str(config_tree / "app.yaml"), "--repeat", "2"]) == 0
+    assert "of 2 loads" in capsys.readouterr().out
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available.")
+def test_serve_runs_commands_sent_with_connect(config_tree: Path) -> None:
+    socket_path = config_tree / "server.sock"
+    command = [sys.executable, "-m", "config_segregate"]
+    server = subprocess.Popen([*command, "serve", str(socket_path)], cwd=Path(__file__).parents[1])
+
+    try:
+        for _ in range(100):
+            if socket_path.exists():
+                break
+
+            time.sleep(0.05)
+
+        for _ in range(2):
+            client = subprocess.run(
+                [*command, "--connect", str(socket_path), "render", "app.yaml"],
+                cwd=config_tree,
+                env={**os.environ, "PYTHONPATH": str(Path(__file__).parents[1])},
+                capture_output=True,
+                check=True,
+            )
+            assert client.stdout.decode() == "database:\n  host: localhost\n  port: 6543\nname: App\n"
+    finally:
+        server.terminate()
+        server.wait(timeout=5)
+
+    assert not socket_path.exists()
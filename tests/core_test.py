@@ -1,8 +1,35 @@
-from typing import Any, Dict, Hashable
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, Hashable, List
 
 import pytest
 
-from config_segregate import load_config
+from config_segregate import (
+    ConfigGraph,
+    IncludeCycleError,
+    IncludeLimitError,
+    LazyConfig,
+    ResolutionContext,
+    load_config,
+    load_config_async,
+    load_configs,
+    merge_nested_dict,
+    resolve_config,
+    write_file,
+)
+from config_segregate.core import (
+    REFERENCE_SCAN_THRESHOLD,
+    load_base_config,
+    load_segregated_configs,
+    update_nested_dict,
+)
+from config_segregate.readers import ASYNC_READER_REGISTRY, READER_REGISTRY, read_json_file
+from config_segregate.writers import _dumps_json
+
+from .conftest import SEGREGATED_CONFIGS
 
 
 def test_loading_and_parsing_of_json_configs(json_configs: Dict[Hashable, Any]) -> None:
@@ -56,4 +83,512 @@ def test_loading_and_parsing_of_random_configs(random_configs: Dict[Hashable, An
         assert loaded_config == expected_config
 
 
+def test_resolution_context_reads_each_file_once(json_configs: Dict[Hashable, Any]) -> None:
+    context = ResolutionContext()
+
+    for path_to_file, expected_config in json_configs.items():
+        if not isinstance(path_to_file, str):
+            raise AssertionError("`path_to_file` should be string.")
+
+        loaded_config = load_config(path_to_file, context)
+
+        assert loaded_config == expected_config
+
+    cache_info = context.cache_info()
+
+    assert cache_info.misses == len(SEGREGATED_CONFIGS)
+    assert cache_info.currsize == len(SEGREGATED_CONFIGS)
+    assert cache_info.hits > 0
+
+
+def test_resolution_context_does_not_leak_updates_between_references(tmp_path: Path) -> None:
+    write_file(tmp_path / "shared.json", {"values": {"a": 1}})
+    write_file(
+        tmp_path / "root.json",
+        {
+            "first": {"__base__": f"${{{{ {tmp_path}/shared.json }}}}", "values": {"b": 2}},
+            "second": f"${{{{ {tmp_path}/shared.json }}}}",
+        },
+    )
+    context = ResolutionContext()
+
+    loaded_config = load_config(tmp_path / "root.json", context)
+
+    assert loaded_config == {"first": {"values": {"a": 1, "b": 2}}, "second": {"values": {"a": 1}}}
+    assert context.cache_info().hits == 1
+
+
+def test_loading_with_thread_and_process_pools(random_configs: Dict[Hashable, Any]) -> None:
+    with ProcessPoolExecutor(2) as executor:
+        for path_to_file, expected_config in random_configs.items():
+            if not isinstance(path_to_file, str):
+                raise AssertionError("`path_to_file` should be string.")
+
+            assert load_config(path_to_file, max_workers=4) == expected_config
+            assert load_config(path_to_file, executor=executor) == expected_config
+
+
+def test_loading_with_thread_pool_overlaps_slow_reads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def read_slow_json_file(path_to_file: Path) -> Dict[Hashable, Any]:
+        time.sleep(0.05)
+        return read_json_file(path_to_file)
+
+    for index in range(8):
+        write_file(tmp_path / f"link_{index}.json", {"index": index})
+
+    write_file(
+        tmp_path / "root.json", {f"link_{index}": f"${{{{ {tmp_path}/link_{index}.json }}}}" for index in range(8)}
+    )
+    monkeypatch.setitem(READER_REGISTRY, ".json", read_slow_json_file)
+
+    started_at = time.perf_counter()
+    sequential_config = load_config(tmp_path / "root.json")
+    sequential_time = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    parallel_config = load_config(tmp_path / "root.json", max_workers=8)
+    parallel_time = time.perf_counter() - started_at
+
+    assert parallel_config == sequential_config
+    assert parallel_time < sequential_time / 2
+
+
+def test_loading_asynchronously(random_configs: Dict[Hashable, Any]) -> None:
+    for path_to_file, expected_config in random_configs.items():
+        if not isinstance(path_to_file, str):
+            raise AssertionError("`path_to_file` should be string.")
+
+        assert asyncio.run(load_config_async(path_to_file)) == expected_config
+
+
+def test_loading_asynchronously_with_async_reader(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    running_reads = 0
+    max_running_reads = 0
+
+    async def read_json_file_async(path_to_file: Path) -> Dict[Hashable, Any]:
+        nonlocal running_reads, max_running_reads
+        running_reads += 1
+        max_running_reads = max(max_running_reads, running_reads)
+        await asyncio.sleep(0.01)
+        running_reads -= 1
+        return read_json_file(path_to_file)
+
+    for index in range(8):
+        write_file(tmp_path / f"link_{index}.json", {"index": index})
+
+    write_file(
+        tmp_path / "root.json", {f"link_{index}": f"${{{{ {tmp_path}/link_{index}.json }}}}" for index in range(8)}
+    )
+    monkeypatch.setitem(ASYNC_READER_REGISTRY, ".json", read_json_file_async)
+
+    loaded_config = asyncio.run(load_config_async(tmp_path / "root.json", max_concurrency=3))
+
+    assert loaded_config == load_config(tmp_path / "root.json")
+    assert max_running_reads == 3
+
+
+def test_lazy_loading_matches_eager_loading(random_configs: Dict[Hashable, Any]) -> None:
+    for path_to_file, expected_config in random_configs.items():
+        if not isinstance(path_to_file, str):
+            raise AssertionError("`path_to_file` should be string.")
+
+        lazy_config = load_config(path_to_file, lazy=True)
+
+        assert isinstance(lazy_config, LazyConfig)
+        assert lazy_config == expected_config
+        assert lazy_config.materialize() == expected_config
+        assert isinstance(lazy_config.materialize(), dict)
+
+
+def test_lazy_loading_reads_only_accessed_references(json_configs: Dict[Hashable, Any], tmp_path: Path) -> None:
+    context = ResolutionContext()
+
+    lazy_config = load_config(tmp_path / "derived_3.json", context, lazy=True)
+
+    assert list(lazy_config) == ["name", "settings", "services", "links"]
+    assert context.files == [tmp_path / "derived_3.json", tmp_path / "base.json"]
+    assert lazy_config["links"]["external"]["name"] == "ExternalLinkConfig"
+    assert context.files[2:] == [tmp_path / "external_link.json"]
+    assert lazy_config["links"]["external"] is lazy_config["links"]["external"]
+
+
+def test_lazy_loading_applies_segregate_options(tmp_path: Path) -> None:
+    write_file(tmp_path / "base.json", {"keep": 1, "obsolete": 2, "nested": {"a": 1, "b": 2}, "replaced": {"a": 1}})
+    write_file(
+        tmp_path / "root.json",
+        {
+            "__base__": f"${{{{ {tmp_path}/base.json }}}}",
+            "__segregate_options__": {"remove_keys": ["obsolete"]},
+            "nested": {"b": 3, "c": [f"${{{{ {tmp_path}/base.json }}}}"]},
+            "replaced": {"__segregate_options__": {"disable_nested_update": True}, "b": 2},
+            "obsolete": "new",
+        },
+    )
+
+    lazy_config = load_config(tmp_path / "root.json", lazy=True)
+
+    assert lazy_config.materialize() == load_config(tmp_path / "root.json")
+    assert list(lazy_config) == ["keep", "nested", "replaced", "obsolete"]
+
+
+def test_lazy_loading_keeps_segregate_options_of_the_base(tmp_path: Path) -> None:
+    write_file(tmp_path / "base.json", {"__segregate_options__": {"remove_keys": []}, "k": 1, "zz": 2})
+    write_file(
+        tmp_path / "root.json",
+        {
+            "s": {
+                "__base__": f"${{{{ {tmp_path}/base.json }}}}",
+                "__segregate_options__": {"remove_keys": ["zz"]},
+                "nested": {"__segregate_options__": {"disable_nested_update": True}, "k": 2},
+            }
+        },
+    )
+
+    eager_config = load_config(tmp_path / "root.json")
+    lazy_config = load_config(tmp_path / "root.json", lazy=True)
+
+    assert eager_config["s"]["__segregate_options__"] == {"remove_keys": []}
+    assert lazy_config.materialize() == eager_config
+    assert list(lazy_config["s"]) == list(eager_config["s"])
+    assert load_config(tmp_path / "root.json", select=["s"]) == eager_config
+
+
+def test_lazy_loading_looks_keys_up_in_constant_time(tmp_path: Path) -> None:
+    write_file(tmp_path / "config.json", {f"key_{index}": index for index in range(20_000)})
+    lazy_config = load_config(tmp_path / "config.json", lazy=True)
+
+    assert lazy_config._key_set() is lazy_config._key_set()
+    assert lazy_config.materialize() == load_config(tmp_path / "config.json")
+
+
+def test_lazy_loading_deep_trees(tmp_path: Path) -> None:
+    depth = 800
+    nested: Dict[Hashable, Any] = {"value": depth}
+
+    for _ in range(depth):
+        nested = {"nested": nested}
+
+    write_file(tmp_path / "nested.json", nested)
+    write_file(tmp_path / f"base_{depth}.json", {"settings": {"level": depth}})
+    write_file(tmp_path / f"link_{depth}.json", {"value": depth})
+
+    for level in reversed(range(depth)):
+        write_file(
+            tmp_path / f"base_{level}.json",
+            {"__base__": f"${{{{ {tmp_path}/base_{level + 1}.json }}}}", "settings": {f"level_{level}": level}},
+        )
+        write_file(tmp_path / f"link_{level}.json", {"next": f"${{{{ {tmp_path}/link_{level + 1}.json }}}}"})
+
+    for name in ["nested.json", "base_0.json", "link_0.json"]:
+        eager_config = load_config(tmp_path / name)
+        key = next(iter(eager_config))
+
+        assert load_config(tmp_path / name, lazy=True).materialize() == eager_config
+        assert load_config(tmp_path / name, select=[key]) == eager_config
+
+
+def test_lazy_loading_rejects_eager_options(json_configs: Dict[Hashable, Any], tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        load_config(tmp_path / "base.json", max_workers=2, lazy=True)
+
+
+def test_loading_selected_key_paths_reads_only_their_references(
+    json_configs: Dict[Hashable, Any], tmp_path: Path
+) -> None:
+    context = ResolutionContext()
+    expected_config = json_configs[str(tmp_path / "derived_3.json")]
+
+    selected_config = load_config(
+        tmp_path / "derived_3.json", context, select=["links.backup_link.secrets", "settings", "links.backup_link"]
+    )
+
+    assert selected_config == {
+        "settings": expected_config["settings"],
+        "links": {"backup_link": expected_config["links"]["backup_link"]},
+    }
+    assert set(context.files) == {
+        tmp_path / "derived_3.json",
+        tmp_path / "base.json",
+        tmp_path / "backup_link.json",
+        tmp_path / "internal_link.json",
+        tmp_path / "backup_secrets.json",
+        tmp_path / "secrets_base.json",
+    }
+
+    selected_config = load_config(tmp_path / "derived_3.json", select=[("services", "cache")])
+
+    assert selected_config == {"services": {"cache": "Memcached"}}
+
+    with pytest.raises(KeyError):
+        load_config(tmp_path / "derived_3.json", select=["links.missing"])
+
+    with pytest.raises(ValueError):
+        load_config(tmp_path / "derived_3.json", max_workers=2, select=["links"])
+
+
+def test_merge_nested_dict_shares_untouched_subtrees() -> None:
+    base: Dict[Hashable, Any] = {"settings": {"language": "English"}, "services": {"cache": {"size": 1}}, "old": 1}
+    updates: Dict[Hashable, Any] = {
+        "__segregate_options__": {"remove_keys": ["old"]},
+        "services": {"database": {"name": "db"}},
+    }
+    expected_config = update_nested_dict(deepcopy(base), deepcopy(updates))
+
+    merged = merge_nested_dict(base, updates)
+
+    assert merged == expected_config
+    assert merged["settings"] is base["settings"]
+    assert merged["services"]["cache"] is base["services"]["cache"]
+    assert merged["services"]["database"] is updates["services"]["database"]
+    assert base == {"settings": {"language": "English"}, "services": {"cache": {"size": 1}}, "old": 1}
+    assert "__segregate_options__" in updates
+
+
+def test_merge_nested_dict_with_disabled_nested_update() -> None:
+    base: Dict[Hashable, Any] = {"settings": {"language": "English"}}
+    updates: Dict[Hashable, Any] = {"__segregate_options__": {"disable_nested_update": True}, "name": "Config"}
+
+    assert merge_nested_dict(base, updates) == update_nested_dict(deepcopy(base), deepcopy(updates))
+    assert merge_nested_dict(base, "replaced") == "replaced"
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_resolve_config_matches_two_pass_pipeline(copy: bool, random_configs: Dict[Hashable, Any]) -> None:
+    for path_to_file in random_configs:
+        if not isinstance(path_to_file, str):
+            raise AssertionError("`path_to_file` should be string.")
+
+        context = ResolutionContext()
+        data = context.read(path_to_file)
+        parsed_files = deepcopy(context._parsed)
+        expected_config = load_base_config(load_segregated_configs(data, ResolutionContext(), path_to_file))
+
+        assert resolve_config(data, context, path_to_file, copy=copy) == expected_config
+        assert {path: context._parsed[path] for path in parsed_files} == parsed_files
+
+
+def test_resolve_config_without_copy_shares_unchanged_subtrees(tmp_path: Path) -> None:
+    write_file(tmp_path / "base.json", {"settings": {"language": "English"}, "services": {"cache": "disabled"}})
+    write_file(
+        tmp_path / "root.json",
+        {"__base__": f"${{{{ {tmp_path}/base.json }}}}", "services": {"cache": "enabled"}, "hosts": [{"a": 1}]},
+    )
+    context = ResolutionContext()
+    data = context.read(tmp_path / "root.json")
+
+    shared_config = resolve_config(data, context, tmp_path / "root.json", copy=False)
+    copied_config = resolve_config(data, context, tmp_path / "root.json")
+
+    assert shared_config == copied_config
+    assert shared_config["hosts"] is data["hosts"]
+    assert shared_config["settings"] is context.read(tmp_path / "base.json")["settings"]
+    assert copied_config["hosts"] is not data["hosts"]
+    assert copied_config["settings"] is not context.read(tmp_path / "base.json")["settings"]
+
+
+def test_resolve_config_passes_large_reference_free_containers_through(tmp_path: Path) -> None:
+    write_file(tmp_path / "link.json", {"name": "Link"})
+    flags = {f"flag_{index}": index % 2 == 0 for index in range(REFERENCE_SCAN_THRESHOLD)}
+    lookup = [{"key": index, "values": [index, (index,)]} for index in range(REFERENCE_SCAN_THRESHOLD)]
+    nested_reference = lookup + [{"link": f"${{{{ {tmp_path}/link.json }}}}"}]
+    nested_base = lookup + [{"__base__": {"name": "Base", "kept": True}, "name": "Derived"}]
+    data: Dict[Hashable, Any] = {
+        "flags": flags,
+        "lookup": lookup,
+        "nested_reference": nested_reference,
+        "nested_base": {"items": {str(index): item for index, item in enumerate(nested_base)}},
+    }
+    expected_config = load_base_config(load_segregated_configs(deepcopy(data)))
+
+    shared_config = resolve_config(data, copy=False)
+    copied_config = resolve_config(data)
+
+    assert shared_config["flags"] is flags
+    assert shared_config["lookup"] is lookup
+    assert copied_config == expected_config
+    assert copied_config["flags"] is not flags
+    assert copied_config["lookup"][0]["values"] == [0, [0]]
+    assert shared_config["nested_reference"][-1] == copied_config["nested_reference"][-1] == {"link": {"name": "Link"}}
+    assert shared_config["nested_base"]["items"][str(REFERENCE_SCAN_THRESHOLD)] == {"name": "Derived", "kept": True}
+
+
+def test_resolve_config_scans_nested_containers_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    linked_data: Dict[Hashable, Any] = {f"key_{index}": index for index in range(REFERENCE_SCAN_THRESHOLD)}
+    write_file(tmp_path / "link.json", linked_data)
+    data: Dict[Hashable, Any] = {"link": f"${{{{ {tmp_path}/link.json }}}}"}
+
+    for _ in range(100):
+        data = {**linked_data, "nested": data}
+
+    scanned: List[Any] = []
+
+    def dumps_json(data: Any) -> bytes:
+        scanned.append(data)
+        return _dumps_json(data)
+
+    monkeypatch.setattr("config_segregate.core._dumps_json", dumps_json)
+    config = resolve_config(data)
+
+    assert len(scanned) == 2
+    assert scanned[0] is data
+
+    for _ in range(100):
+        config = config["nested"]
+
+    assert config == {"link": linked_data}
+
+
+def test_loading_deeply_nested_references(tmp_path: Path) -> None:
+    depth = 800
+    write_file(tmp_path / f"level_{depth}.json", {"value": depth})
+
+    for level in reversed(range(depth)):
+        write_file(tmp_path / f"level_{level}.json", {"next": f"${{{{ {tmp_path}/level_{level + 1}.json }}}}"})
+
+    config = load_config(tmp_path / "level_0.json")
+
+    for _ in range(depth):
+        config = config["next"]
+
+    assert config == {"value": depth}
+
+
+def test_include_cycle_is_reported(tmp_path: Path) -> None:
+    write_file(tmp_path / "a.json", {"__base__": f"${{{{ {tmp_path}/b.json }}}}", "a": 1})
+    write_file(tmp_path / "b.json", {"nested": {"back": f"${{{{ {tmp_path}/a.json }}}}"}})
+    write_file(tmp_path / "self.json", {"__base__": f"${{{{ {tmp_path}/self.json }}}}"})
+
+    with pytest.raises(IncludeCycleError) as error_info:
+        load_config(tmp_path / "a.json")
+
+    a_path, b_path = (tmp_path / "a.json").resolve(), (tmp_path / "b.json").resolve()
+    assert error_info.value.chain == (a_path, b_path, a_path)
+
+    with pytest.raises(IncludeCycleError):
+        load_config(tmp_path / "self.json")
+
+    with pytest.raises(IncludeCycleError):
+        load_config(tmp_path / "a.json", lazy=True).materialize()
+
+    with pytest.raises(IncludeCycleError):
+        ConfigGraph(tmp_path / "a.json")
+
+
+def test_resolution_context_limits(json_configs: Dict[Hashable, Any], tmp_path: Path) -> None:
+    expected_config = load_config(tmp_path / "derived_2.json")
+
+    assert load_config(tmp_path / "derived_2.json", ResolutionContext(max_depth=3)) == expected_config
+
+    with pytest.raises(IncludeLimitError):
+        load_config(tmp_path / "derived_2.json", ResolutionContext(max_depth=1))
+
+    with pytest.raises(IncludeLimitError):
+        load_config(tmp_path / "derived_2.json", ResolutionContext(max_files=1))
+
+
+def test_loading_with_file_relative_references(tmp_path: Path) -> None:
+    for name in ("first", "second"):
+        for folder in ("shared", "settings"):
+            (tmp_path / name / folder).mkdir(parents=True)
+
+        write_file(tmp_path / name / "shared" / "base.json", {"name": name, "values": {"a": 1}})
+        write_file(tmp_path / name / "settings" / "values.json", {"__base__": "${{ ../shared/base.json }}"})
+        write_file(
+            tmp_path / name / "config.json",
+            {
+                "settings": "${{ ./settings/values.json }}",
+                "base": "${{ shared/../shared/base.json }}",
+                "copies": ["${{ ./shared/base.json }}", "${{ shared/base.json }}"],
+            },
+        )
+
+    def load(name: str) -> Dict[Hashable, Any]:
+        context = ResolutionContext(relative_to_file=True)
+        config = load_config(tmp_path / name / "config.json", context, max_workers=2)
+
+        assert load_config(tmp_path / name / "config.json", context, lazy=True).materialize() == config
+        assert context.cache_info().currsize == 3
+
+        return config
+
+    with ThreadPoolExecutor(2) as executor:
+        first_config, second_config = executor.map(load, ["first", "second"])
+
+    assert first_config == {
+        "settings": {"name": "first", "values": {"a": 1}},
+        "base": {"name": "first", "values": {"a": 1}},
+        "copies": [{"name": "first", "values": {"a": 1}}, {"name": "first", "values": {"a": 1}}],
+    }
+    assert second_config["settings"]["name"] == "second"
+    assert ConfigGraph(tmp_path / "first" / "config.json", relative_to_file=True).config == first_config
+
+
+def test_loading_many_configs_shares_parsed_bases(tmp_path: Path) -> None:
+    write_file(tmp_path / "base.json", {"settings": {"language": "English", "timezone": "UTC"}})
+    write_file(tmp_path / "region.json", {"__base__": f"${{{{ {tmp_path}/base.json }}}}", "settings": {"region": "eu"}})
+    paths = [tmp_path / f"tenant_{index}.json" for index in range(20)]
+
+    for index, path in enumerate(paths):
+        write_file(path, {"__base__": f"${{{{ {tmp_path}/region.json }}}}", "tenant": index})
+
+    context = ResolutionContext()
+    results = load_configs(iter(paths), context)
+
+    assert next(results) == (paths[0], load_config(paths[0]))
+    assert [path for path, _ in results] == paths[1:]
+    assert context.cache_info().misses == len(paths) + 2
+    assert context.cache_info().currsize == 2
+
+    with ProcessPoolExecutor(2) as executor:
+        pooled_results = list(load_configs(paths, executor=executor, chunksize=3, max_pending=2))
+
+    assert pooled_results == [(path, load_config(path)) for path in paths]
+
+
+def test_loading_many_configs_shares_interleaved_bases(tmp_path: Path) -> None:
+    for chain in range(3):
+        write_file(tmp_path / f"base_{chain}.json", {"settings": {"chain": chain}})
+        write_file(
+            tmp_path / f"region_{chain}.json",
+            {"__base__": f"${{{{ {tmp_path}/base_{chain}.json }}}}", "region": f"region_{chain}"},
+        )
+
+    paths = [tmp_path / f"tenant_{index}.json" for index in range(300)]
+
+    for index, path in enumerate(paths):
+        write_file(path, {"__base__": f"${{{{ {tmp_path}/region_{index % 3}.json }}}}", "tenant": index})
+
+    context = ResolutionContext()
+    configs = [config for _, config in load_configs(paths, context)]
+
+    assert configs[4] == {"settings": {"chain": 1}, "region": "region_1", "tenant": 4}
+    assert context.cache_info().misses == len(paths) + 6
+    assert context.cache_info().currsize == 6
+
+
+def test_loading_many_configs_evicts_least_recently_used_files(tmp_path: Path) -> None:
+    write_file(tmp_path / "base.json", {"settings": {"language": "English"}})
+    paths = [tmp_path / f"tenant_{index}.json" for index in range(20)]
+
+    for index, path in enumerate(paths):
+        write_file(tmp_path / f"secrets_{index}.json", {"token": f"token_{index}"})
+        write_file(
+            path,
+            {"__base__": f"${{{{ {tmp_path}/base.json }}}}", "secrets": f"${{{{ {tmp_path}/secrets_{index}.json }}}}"},
+        )
+
+    context = ResolutionContext()
+    sizes = [context.cache_info().currsize for _ in load_configs(paths, context, maxsize=2)]
+
+    assert sizes == [2] * len(paths)
+    assert set(context.files) == {(tmp_path / "base.json").resolve(), (tmp_path / "secrets_19.json").resolve()}
+    assert context.cache_info().misses == 2 * len(paths) + 1
+
+    context = ResolutionContext()
+    maxbytes = (tmp_path / "base.json").stat().st_size + (tmp_path / "secrets_19.json").stat().st_size
+    list(load_configs(paths, context, maxbytes=maxbytes))
+
+    assert set(context.files) == {(tmp_path / "base.json").resolve(), (tmp_path / "secrets_19.json").resolve()}
+
+
 # TODO try test for unexisting path, wrong file format, registering file reader/ writer,
@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Union
+
+import pytest
+
+from config_segregate import KeyPath, ResolutionContext, load_config, write_segregated
+
+
+def _dict_key_paths(data: Dict[Hashable, Any], prefix: KeyPath = ()) -> List[KeyPath]:
+    key_paths: List[KeyPath] = []
+
+    for key, value in data.items():
+        if isinstance(value, dict):
+            key_paths.append(prefix + (key,))
+            key_paths.extend(_dict_key_paths(value, prefix + (key,)))
+
+    return key_paths
+
+
+@pytest.mark.parametrize("ext", ["json", "yaml", "toml"])
+def test_segregated_configs_round_trip(ext: str, json_configs: Dict[Hashable, Any], tmp_path: Path) -> None:
+    for index, expected_config in enumerate(json_configs.values()):
+        folder = tmp_path / f"export_{index}"
+        folder.mkdir()
+
+        written = write_segregated(expected_config, folder / f"config.{ext}", _dict_key_paths(expected_config))
+
+        assert next(iter(written)) == folder / f"config.{ext}"
+        assert sorted(written) == sorted(folder.iterdir())
+        assert load_config(folder / f"config.{ext}") == expected_config
+
+
+def test_identical_sections_share_a_file(tmp_path: Path) -> None:
+    config: Dict[Hashable, Any] = {
+        "services": {"database": {"host": "localhost", "port": 5432}, "replica": {"host": "localhost", "port": 5432}},
+        "environments": {"prod": {"level": "info"}, "dev": {"level": "debug"}},
+    }
+    layout: List[Union[str, KeyPath]] = [
+        "services.database",
+        "services.replica",
+        "environments.prod",
+        ("environments", "dev"),
+        "services",
+    ]
+
+    with ThreadPoolExecutor(4) as executor:
+        written = write_segregated(config, tmp_path / "config.yaml", layout, executor=executor, relative_to_file=True)
+
+    assert sorted(path.name for path in written) == [
+        "config.environments.dev.yaml",
+        "config.environments.prod.yaml",
+        "config.services.database.yaml",
+        "config.services.yaml",
+        "config.yaml",
+    ]
+    assert (tmp_path / "config.services.yaml").read_text().count("config.services.database.yaml") == 2
+    assert load_config(tmp_path / "config.yaml", ResolutionContext(relative_to_file=True)) == config
+    assert config["services"]["database"] == {"host": "localhost", "port": 5432}
+
+    written = write_segregated(
+        config, tmp_path / "config.yaml", layout, max_workers=4, overwrite=True, skip_unchanged=True
+    )
+
+    assert written[tmp_path / "config.yaml"]
+    assert not written[tmp_path / "config.services.database.yaml"]
+
+
+def test_invalid_layouts_are_rejected(tmp_path: Path) -> None:
+    config: Dict[Hashable, Any] = {
+        "name": "Config",
+        "services": {"database": {"host": "localhost"}},
+        "services.database": {"host": "remote"},
+    }
+
+    with pytest.raises(KeyError):
+        write_segregated(config, tmp_path / "config.json", ["services.cache"])
+
+    with pytest.raises(ValueError):
+        write_segregated(config, tmp_path / "config.json", ["name"])
+
+    with pytest.raises(ValueError):
+        write_segregated(config, tmp_path / "config.json", [()])
+
+    with pytest.raises(ValueError):
+        write_segregated(config, tmp_path / "config.json", ["services.database", ("services.database",)])
+
+    with pytest.raises(ValueError):
+        write_segregated({"link": "${{ base.json }}"}, tmp_path / "config.json", [])
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,104 @@
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Hashable
+
+import pytest
+
+from config_segregate import FrozenDict, freeze, load_config, write_file
+
+
+def test_frozen_config_equals_mutable_config(json_configs: Dict[Hashable, Any], tmp_path: Path) -> None:
+    for path_to_file, expected_config in json_configs.items():
+        if not isinstance(path_to_file, str):
+            raise AssertionError("`path_to_file` should be string.")
+
+        frozen_config = load_config(path_to_file, frozen=True)
+
+        assert isinstance(frozen_config, FrozenDict)
+        assert frozen_config == expected_config
+        assert hash(frozen_config) == hash(load_config(path_to_file, frozen=True))
+        assert pickle.loads(pickle.dumps(frozen_config)) == frozen_config
+
+
+def test_frozen_config_is_immutable(tmp_path: Path) -> None:
+    write_file(tmp_path / "config.json", {"name": "Config", "values": [1, 2], "nested": {"key": "value"}})
+    frozen_config = load_config(tmp_path / "config.json", frozen=True)
+
+    assert frozen_config["values"] == (1, 2)
+
+    with pytest.raises(TypeError):
+        frozen_config["name"] = "Changed"  # type: ignore[index]
+
+    with pytest.raises(AttributeError):
+        frozen_config._data = dict()
+
+    with pytest.raises(AttributeError):
+        frozen_config.nested = None
+
+
+def test_equal_sections_are_interned(tmp_path: Path) -> None:
+    section: Dict[Hashable, Any] = {"enabled": True, "limits": {"cpu": 2, "memory": 1.5}, "tags": ["a", "b"]}
+    write_file(tmp_path / "first.json", section)
+    write_file(tmp_path / "second.json", section)
+    write_file(
+        tmp_path / "config.json",
+        {"first": f"${{{{ {tmp_path}/first.json }}}}", "second": f"${{{{ {tmp_path}/second.json }}}}"},
+    )
+    frozen_config = load_config(tmp_path / "config.json", frozen=True)
+
+    assert frozen_config["first"] is frozen_config["second"]
+    assert frozen_config["first"]["tags"] == ("a", "b")
+
+
+def test_values_of_different_types_are_not_interned() -> None:
+    frozen_data = freeze({"int": {"value": 1}, "bool": {"value": True}, "zero": [0.0], "negative_zero": [-0.0]})
+
+    assert frozen_data["int"]["value"] is not True
+    assert frozen_data["bool"]["value"] is True
+    assert str(frozen_data["negative_zero"][0]) == "-0.0"
+
+
+def test_frozen_cannot_be_lazy(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        load_config(tmp_path / "config.json", lazy=True, frozen=True)  # type: ignore[call-overload]
+
+
+def test_frozen_data_equals_mappings_holding_lists() -> None:
+    data: Dict[Hashable, Any] = {"values": [1, 2], "nested": {"tags": ["a", ("b", [3])]}}
+    frozen_data = freeze(data)
+
+    assert frozen_data == data
+    assert data == frozen_data
+    assert frozen_data != {"values": [1, 2, 3], "nested": {"tags": ["a", ("b", [3])]}}
+    assert frozen_data != {"values": [1, 2]}
+
+
+def test_freezing_deeply_nested_data() -> None:
+    depth = 5000
+    data: Dict[Hashable, Any] = {"value": [depth]}
+
+    for level in reversed(range(depth)):
+        data = {"nested": data, "values": [level, [level]]}
+
+    frozen_data = freeze(data)
+
+    for level in range(depth):
+        assert frozen_data["values"] == (level, (level,))
+        frozen_data = frozen_data["nested"]
+
+    assert frozen_data == FrozenDict({"value": (depth,)})
+
+
+def test_freezing_deeply_nested_references(tmp_path: Path) -> None:
+    depth = 800
+    write_file(tmp_path / f"level_{depth}.json", {"value": depth})
+
+    for level in reversed(range(depth)):
+        write_file(tmp_path / f"level_{level}.json", {"next": f"${{{{ {tmp_path}/level_{level + 1}.json }}}}"})
+
+    frozen_config = load_config(tmp_path / "level_0.json", frozen=True)
+
+    for _ in range(depth):
+        frozen_config = frozen_config["next"]
+
+    assert frozen_config == {"value": depth}
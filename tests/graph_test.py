@@ -0,0 +1,88 @@
+from pathlib import Path
+from typing import Any, Dict, Hashable, List
+
+import pytest
+
+from config_segregate import ConfigGraph, diff_configs, load_config, write_file
+from config_segregate.readers import READER_REGISTRY, read_json_file
+
+
+@pytest.fixture()
+def read_paths(monkeypatch: pytest.MonkeyPatch) -> List[Path]:
+    paths: List[Path] = []
+
+    def read_and_record(path_to_file: Path) -> Dict[Hashable, Any]:
+        paths.append(path_to_file.resolve())
+        return read_json_file(path_to_file)
+
+    monkeypatch.setitem(READER_REGISTRY, ".json", read_and_record)
+    return paths
+
+
+def test_config_graph_matches_load_config(random_configs: Dict[Hashable, Any]) -> None:
+    for path_to_file, expected_config in random_configs.items():
+        if not isinstance(path_to_file, str):
+            raise AssertionError("`path_to_file` should be string.")
+
+        graph = ConfigGraph(path_to_file)
+
+        assert graph.config == expected_config
+        assert graph.config == load_config(path_to_file)
+
+
+def test_config_graph_refresh_rereads_only_changed_files(
+    json_configs: Dict[Hashable, Any], read_paths: List[Path], tmp_path: Path
+) -> None:
+    graph = ConfigGraph(tmp_path / "derived_2.json")
+
+    assert graph.refresh() == (graph.config, [])
+
+    read_paths.clear()
+    (tmp_path / "link_3.json").write_text('{"name": "ChangedLinkConfig3", "data": {"priority": "high"}}')
+
+    config, changed = graph.refresh()
+
+    assert read_paths == [tmp_path / "link_3.json"]
+    assert changed == [
+        ("additional_links", "third", "name"),
+        ("additional_links", "third", "data", "mode"),
+        ("additional_links", "fourth", "data", "mode"),
+    ]
+    assert config == load_config(tmp_path / "derived_2.json")
+
+
+def test_config_graph_refresh_follows_new_references(json_configs: Dict[Hashable, Any], tmp_path: Path) -> None:
+    graph = ConfigGraph(tmp_path / "link_1.json")
+    write_file(tmp_path / "extra.json", {"enabled": True})
+    (tmp_path / "link_1.json").write_text(f'{{"name": "LinkConfig1", "extra": "${{{{ {tmp_path}/extra.json }}}}"}}')
+
+    config, changed = graph.refresh()
+
+    assert config == {"name": "LinkConfig1", "extra": {"enabled": True}}
+    assert changed == [("features",), ("extra",)]
+    assert graph.references(tmp_path / "link_1.json") == {("extra",): tmp_path / "extra.json"}
+
+
+def test_config_graph_follows_deep_reference_chains(tmp_path: Path) -> None:
+    depth = 800
+    write_file(tmp_path / f"level_{depth}.json", {"value": depth})
+
+    for level in reversed(range(depth)):
+        write_file(tmp_path / f"level_{level}.json", {"next": f"${{{{ {tmp_path}/level_{level + 1}.json }}}}"})
+
+    graph = ConfigGraph(tmp_path / "level_0.json")
+
+    assert graph.config == load_config(tmp_path / "level_0.json")
+
+    write_file(tmp_path / f"level_{depth}.json", {"value": -1}, overwrite=True)
+    config, changed = graph.refresh()
+
+    assert changed == [("next",) * depth + ("value",)]
+    assert config == load_config(tmp_path / "level_0.json")
+
+
+def test_diff_configs() -> None:
+    old = {"name": "Config", "settings": {"language": "English", "timezone": "UTC"}}
+    new = {"name": "Config", "settings": {"language": "French"}, "services": {}}
+
+    assert diff_configs(old, new) == [("settings", "language"), ("settings", "timezone"), ("services",)]
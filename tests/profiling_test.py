@@ -0,0 +1,40 @@
+from pathlib import Path
+from typing import Any, Dict, Hashable
+
+from config_segregate import ProfileCollector, load_config
+from config_segregate.profiling import OBSERVERS
+
+
+def test_profile_collector_reports_reads_resolutions_and_merges(
+    json_configs: Dict[Hashable, Any], tmp_path: Path
+) -> None:
+    with ProfileCollector() as collector:
+        config = load_config(tmp_path / "derived_2.json")
+
+    assert not OBSERVERS
+    assert config == json_configs[f"{tmp_path}/derived_2.json"]
+
+    kinds = [event.kind for event in collector.events]
+    read_paths = {event.path.resolve() for event in collector.events if event.kind == "read" and event.path}
+    derived_1_path = (tmp_path / "derived_1.json").resolve()
+
+    assert kinds.count("load") == 1
+    assert kinds.count("stat") == kinds.count("read") == len(read_paths) == 7
+    assert kinds.count("merge") == 3
+    assert any(
+        event.kind == "resolve" and event.path == (tmp_path / "base.json").resolve() and event.depth == 2
+        for event in collector.events
+    )
+
+    table = collector.table()
+    folded = collector.folded().splitlines()
+
+    assert len(table.splitlines()) == len(read_paths) + 2
+    assert f"load_config;{(tmp_path / 'derived_2.json').resolve()};{derived_1_path}" in [
+        line.rsplit(" ", 1)[0] for line in folded
+    ]
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded)
+
+    load_config(tmp_path / "derived_2.json")
+
+    assert len(collector.events) == len(kinds)
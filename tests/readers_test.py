@@ -0,0 +1,208 @@
+import math
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator
+
+import pytest
+import yaml
+
+from config_segregate import (
+    cache_clear,
+    cache_info,
+    disable_cache,
+    enable_cache,
+    load_config,
+    read_file,
+    readers,
+    register_buffer_reader,
+    write_file,
+    writers,
+)
+
+
+@pytest.fixture()
+def file_cache() -> Iterator[None]:
+    enable_cache()
+    yield
+    disable_cache()
+
+
+def test_file_cache_hits_until_file_changes(file_cache: None, tmp_path: Path) -> None:
+    path_to_file = tmp_path / "config.json"
+    write_file(path_to_file, {"name": "Config"})
+
+    assert read_file(path_to_file) == {"name": "Config"}
+    assert read_file(path_to_file) == {"name": "Config"}
+    assert cache_info().hits == 1
+    assert cache_info().misses == 1
+
+    path_to_file.write_text('{"name": "ChangedConfig"}')
+
+    assert read_file(path_to_file) == {"name": "ChangedConfig"}
+    assert cache_info().misses == 2
+    assert cache_info().currsize == 1
+
+    cache_clear()
+
+    assert cache_info() == (0, 0, 128, 0)
+
+
+def test_file_cache_hands_out_copies(file_cache: None, tmp_path: Path) -> None:
+    path_to_file = tmp_path / "config.json"
+    write_file(path_to_file, {"settings": {"language": "English"}})
+
+    read_file(path_to_file)["settings"]["language"] = "French"
+
+    assert read_file(path_to_file) == {"settings": {"language": "English"}}
+
+
+def test_file_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    enable_cache(maxsize=2)
+    try:
+        for name in ["first", "second", "third"]:
+            write_file(tmp_path / f"{name}.json", {"name": name})
+
+        read_file(tmp_path / "first.json")
+        read_file(tmp_path / "second.json")
+        read_file(tmp_path / "first.json")
+        read_file(tmp_path / "third.json")
+
+        read_file(tmp_path / "first.json")
+        assert cache_info().hits == 2
+
+        read_file(tmp_path / "second.json")
+        assert cache_info().hits == 2
+        assert cache_info().currsize == 2
+    finally:
+        disable_cache()
+
+
+def test_file_cache_respects_byte_budget(tmp_path: Path) -> None:
+    write_file(tmp_path / "small.json", {"name": "small"})
+    write_file(tmp_path / "large.json", {"name": "large" * 100})
+    enable_cache(maxbytes=os.path.getsize(tmp_path / "large.json") - 1)
+    try:
+        read_file(tmp_path / "large.json")
+        read_file(tmp_path / "small.json")
+
+        assert cache_info().currsize == 1
+    finally:
+        disable_cache()
+
+
+def test_reload_with_file_cache_only_hits(file_cache: None, json_configs: Dict[Hashable, Any]) -> None:
+    for path_to_file, expected_config in json_configs.items():
+        if not isinstance(path_to_file, str):
+            raise AssertionError("`path_to_file` should be string.")
+
+        assert load_config(path_to_file) == expected_config
+
+    misses = cache_info().misses
+
+    for path_to_file, expected_config in json_configs.items():
+        if not isinstance(path_to_file, str):
+            raise AssertionError("`path_to_file` should be string.")
+
+        assert load_config(path_to_file) == expected_config
+
+    assert cache_info().misses == misses
+
+
+def test_yaml_backend_matches_pure_python(tmp_path: Path) -> None:
+    data: Dict[Hashable, Any] = {"name": "Config", "values": [1, 2.5, None, True], "nested": {"date": "2024-01-01"}}
+    write_file(tmp_path / "config.yaml", data)
+
+    assert readers.WITH_LIBYAML == writers.WITH_LIBYAML == yaml.__with_libyaml__
+    assert writers.JSON_BACKEND == readers.JSON_BACKEND
+    assert read_file(tmp_path / "config.yaml") == yaml.safe_load((tmp_path / "config.yaml").read_text()) == data
+
+
+@pytest.mark.parametrize("json_backend", sorted({"json", readers.JSON_BACKEND}))
+def test_json_backends_read_and_write_the_same_data(
+    json_backend: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(readers, "JSON_BACKEND", json_backend)
+    data: Dict[Hashable, Any] = {"name": "Config", "values": [1, 2.5, None, True], "nested": {"unicode": "żółw"}}
+    write_file(tmp_path / "config.json", data)
+
+    assert read_file(tmp_path / "config.json") == data
+
+
+def test_json_reader_falls_back_to_standard_library(tmp_path: Path) -> None:
+    (tmp_path / "config.json").write_text('{"limit": Infinity, "big": 123456789012345678901234567890}')
+
+    assert read_file(tmp_path / "config.json") == {"limit": float("inf"), "big": 123456789012345678901234567890}
+
+
+def test_json_writer_falls_back_to_standard_library(tmp_path: Path) -> None:
+    data: Dict[Hashable, Any] = {"big": 2**70, "limits": [float("inf"), -float("inf"), None], "missing": None}
+    write_file(tmp_path / "config.json", data)
+    written_data = read_file(tmp_path / "config.json")
+
+    assert written_data == data
+
+    write_file(tmp_path / "nan.json", {"value": float("nan")})
+
+    assert math.isnan(read_file(tmp_path / "nan.json")["value"])
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, readers.MMAP_THRESHOLD])
+def test_buffer_readers_parse_file_content(mmap_threshold: int, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(readers, "MMAP_THRESHOLD", mmap_threshold)
+    monkeypatch.setattr(readers, "READER_REGISTRY", dict(readers.READER_REGISTRY))
+    buffer_types = []
+
+    def read_lines(content: memoryview) -> Dict[Hashable, Any]:
+        buffer_types.append(type(content))
+        return {"lines": bytes(content).decode().splitlines()}
+
+    register_buffer_reader(".lines", read_lines)
+    (tmp_path / "config.lines").write_text("first\nsecond\n")
+    (tmp_path / "empty.lines").write_text("")
+
+    assert read_file(tmp_path / "config.lines") == {"lines": ["first", "second"]}
+    assert read_file(tmp_path / "empty.lines") == {"lines": []}
+    assert buffer_types == [memoryview, memoryview]
+
+
+def test_json_reader_parses_mapped_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(readers, "MMAP_THRESHOLD", 0)
+    data: Dict[Hashable, Any] = {f"section_{index}": {"values": list(range(100))} for index in range(100)}
+    write_file(tmp_path / "config.json", data)
+
+    assert read_file(tmp_path / "config.json") == data
+
+
+def _imported_modules(code: str) -> Dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: Dict[str, int] = dict()
+
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and not line.endswith("| imported package"):
+            _, cumulative, name = line[len("import time:") :].split("|")
+            modules[name.strip()] = int(cumulative)
+
+    return modules
+
+
+def test_import_does_not_load_format_backends() -> None:
+    modules = _imported_modules("import config_segregate")
+
+    assert "config_segregate" in modules
+    assert not {"json", "yaml", "toml", "orjson", "msgspec", "asyncio", "importlib.metadata"} & set(modules)
+
+
+def test_format_backends_load_on_first_use(tmp_path: Path) -> None:
+    (tmp_path / "config.json").write_text('{"name": "Config"}')
+    modules = _imported_modules(f"import config_segregate; config_segregate.read_file({str(tmp_path / 'config.json')!r})")
+
+    assert readers.JSON_BACKEND in modules
+    assert not {"yaml", "toml"} & set(modules)
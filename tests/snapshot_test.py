@@ -0,0 +1,76 @@
+import os
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional
+
+import pytest
+
+from config_segregate import load_config, load_snapshot
+from config_segregate.readers import READER_REGISTRY
+
+
+def read_nothing(path_to_file: Path) -> Dict[Hashable, Any]:
+    raise AssertionError(f"`{path_to_file}` should not be read.")
+
+
+def test_loading_from_snapshot_skips_reading(
+    json_configs: Dict[Hashable, Any], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path_to_file = tmp_path / "derived_3.json"
+    path_to_snapshot = tmp_path / "derived_3.snapshot"
+    expected_config = json_configs[str(path_to_file)]
+
+    assert load_config(path_to_file, snapshot=path_to_snapshot) == expected_config
+    assert path_to_snapshot.exists()
+
+    monkeypatch.setitem(READER_REGISTRY, ".json", read_nothing)
+
+    assert load_config(path_to_file, snapshot=path_to_snapshot) == expected_config
+
+
+def test_snapshot_is_outdated_by_changed_source_file(json_configs: Dict[Hashable, Any], tmp_path: Path) -> None:
+    path_to_file = tmp_path / "derived_3.json"
+    path_to_snapshot = tmp_path / "derived_3.snapshot"
+    load_config(path_to_file, snapshot=path_to_snapshot)
+
+    (tmp_path / "secrets_base.json").write_text('{"name": "SecretsBase", "key": "rotated_key"}')
+
+    assert load_snapshot(path_to_snapshot, path_to_file) is None
+
+    loaded_config = load_config(path_to_file, snapshot=path_to_snapshot)
+
+    assert loaded_config["links"]["backup_link"]["secrets"]["key"] == "rotated_key"
+    assert load_snapshot(path_to_snapshot, path_to_file) == loaded_config
+
+
+def test_snapshot_survives_touched_source_file(json_configs: Dict[Hashable, Any], tmp_path: Path) -> None:
+    path_to_file = tmp_path / "derived_1.json"
+    path_to_snapshot = tmp_path / "derived_1.snapshot"
+    loaded_config = load_config(path_to_file, snapshot=path_to_snapshot)
+
+    os.utime(tmp_path / "base.json", ns=(0, 0))
+
+    assert load_snapshot(path_to_snapshot, path_to_file) == loaded_config
+    assert load_snapshot(path_to_snapshot, tmp_path / "derived_2.json") is None
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_snapshot_is_not_saved_for_files_changed_after_reading(
+    max_workers: Optional[int], json_configs: Dict[Hashable, Any], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path_to_file = tmp_path / "derived_1.json"
+    path_to_snapshot = tmp_path / "derived_1.snapshot"
+    read_json_file = READER_REGISTRY[".json"]
+
+    def read_and_change(path_to_file: Path) -> Dict[Hashable, Any]:
+        data = read_json_file(path_to_file)
+
+        if path_to_file.name == "base.json":
+            path_to_file.write_text('{"name": "ChangedBase", "settings": {}, "services": {}}')
+
+        return data
+
+    monkeypatch.setitem(READER_REGISTRY, ".json", read_and_change)
+    loaded_config = load_config(path_to_file, max_workers=max_workers, snapshot=path_to_snapshot)
+
+    assert loaded_config == json_configs[str(path_to_file)]
+    assert not path_to_snapshot.exists()
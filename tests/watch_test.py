@@ -0,0 +1,77 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Hashable, List
+
+import pytest
+
+from config_segregate import ConfigWatcher, load_config, watch_config, write_file
+from config_segregate.watch import _load_libc
+
+
+@pytest.fixture()
+def config_files(tmp_path: Path) -> Path:
+    write_file(tmp_path / "base.json", {"settings": {"language": "English", "timezone": "UTC"}})
+    write_file(tmp_path / "config.json", {"__base__": f"${{{{ {tmp_path}/base.json }}}}", "name": "Config"})
+    write_file(tmp_path / "unrelated.json", {"name": "Unrelated"})
+
+    return tmp_path / "config.json"
+
+
+def test_config_watcher_check_reloads_only_on_changes(config_files: Path) -> None:
+    received: List[Dict[Hashable, Any]] = []
+    errors: List[Exception] = []
+    watcher = ConfigWatcher(config_files, on_error=errors.append)
+    watcher.subscribe(received.append)
+
+    (config_files.parent / "unrelated.json").write_text(json.dumps({"name": "Changed"}))
+    assert not watcher.check()
+
+    (config_files.parent / "base.json").write_text("{")
+    assert not watcher.check()
+    assert len(errors) == 1
+
+    (config_files.parent / "base.json").write_text(json.dumps({"settings": {"language": "Spanish"}}))
+    assert watcher.check()
+    assert received == [load_config(config_files)]
+    assert watcher.config == {"settings": {"language": "Spanish"}, "name": "Config"}
+
+
+@pytest.mark.parametrize(
+    "use_inotify",
+    [False, pytest.param(True, marks=pytest.mark.skipif(_load_libc() is None, reason="inotify is not available"))],
+)
+def test_watch_config_pushes_reloaded_configs(config_files: Path, use_inotify: bool) -> None:
+    received: List[Dict[Hashable, Any]] = []
+    reloaded = threading.Event()
+
+    def callback(config: Dict[Hashable, Any]) -> None:
+        received.append(config)
+
+        if config["settings"]["language"] == "Spanish":
+            reloaded.set()
+
+    with watch_config(config_files, callback, interval=0.02, debounce=0.05, use_inotify=use_inotify):
+        for language in ("French", "German", "Spanish"):
+            (config_files.parent / "base.json").write_text(json.dumps({"settings": {"language": language}}))
+
+        assert reloaded.wait(5)
+
+    assert received[-1] == {"settings": {"language": "Spanish"}, "name": "Config"}
+
+
+def test_polling_waits_for_the_files_to_settle(config_files: Path) -> None:
+    received: List[Dict[Hashable, Any]] = []
+
+    with watch_config(config_files, received.append, interval=0.01, debounce=0.3, use_inotify=False) as watcher:
+        for index in range(25):
+            (config_files.parent / "base.json").write_text(json.dumps({"settings": {"index": index}}))
+            time.sleep(0.02)
+
+        deadline = time.monotonic() + 5
+
+        while watcher.config["settings"] != {"index": 24} and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert received == [{"settings": {"index": 24}, "name": "Config"}]
@@ -0,0 +1,57 @@
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from config_segregate import read_file, write_file, writers
+
+
+@pytest.mark.parametrize("ext", [".json", ".yaml", ".toml"])
+def test_writing_over_existing_files(ext: str, tmp_path: Path) -> None:
+    path = tmp_path / f"config{ext}"
+    write_file(path, {"name": "Config", "version": 1})
+
+    with pytest.raises(FileExistsError):
+        write_file(path, {"name": "Config", "version": 2})
+
+    assert write_file(path, {"name": "Config", "version": 2}, overwrite=True, atomic=True)
+    assert read_file(path) == {"name": "Config", "version": 2}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_atomic_writing_keeps_permissions_and_previous_content_on_failure(tmp_path: Path) -> None:
+    path = tmp_path / "config.json"
+    write_file(path, {"name": "Config"})
+    os.chmod(path, 0o600)
+
+    write_file(path, {"name": "Changed"}, overwrite=True, atomic=True)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    with pytest.raises(TypeError):
+        write_file(path, {"name": object()}, overwrite=True, atomic=True)
+
+    assert read_file(path) == {"name": "Changed"}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_writing_skips_unchanged_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "config.yaml"
+    write_file(path, {"name": "Config"})
+    os.utime(path, (0, 0))
+
+    assert not write_file(path, {"name": "Config"}, overwrite=True, skip_unchanged=True)
+    assert os.stat(path).st_mtime == 0
+    assert write_file(path, {"name": "Changed"}, overwrite=True, skip_unchanged=True)
+    assert read_file(path) == {"name": "Changed"}
+
+    # Writers working on paths are compared through a temporary file, which is never left behind.
+    monkeypatch.setitem(writers.WRITER_REGISTRY, ".custom", lambda path_to_file, data: path_to_file.write_text(str(data)))
+    write_file(tmp_path / "config.custom", {"name": "Config"})
+    os.utime(tmp_path / "config.custom", (0, 0))
+
+    assert not write_file(tmp_path / "config.custom", {"name": "Config"}, overwrite=True, skip_unchanged=True)
+    assert os.stat(tmp_path / "config.custom").st_mtime == 0
+    assert write_file(tmp_path / "config.custom", {"name": "Changed"}, overwrite=True, atomic=True, skip_unchanged=True)
+    assert (tmp_path / "config.custom").read_text() == str({"name": "Changed"})
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["config.custom", "config.yaml"]